@@ -27,25 +27,39 @@ Usage:
 Command line options:
   -v, --verbose    Enable warning level logging
   -vv, --debug     Enable debug level logging
+  --daemon         Keep running and sync every --interval seconds (default 300)
 """
 
 import datetime
+import functools
+import io
+import itertools
 import os.path
+import random
 import re
+import time
 import requests
+from urllib3.util.retry import Retry
 import json
 import base64
+import hashlib
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from typing import List, Optional, Dict, Union, Tuple
-from icalendar import Calendar, vDate
+from typing import List, Optional, Dict, Set, Union, Tuple, Iterable, Iterator
+from zoneinfo import ZoneInfo
+from icalendar import Calendar
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 # If modifying these scopes, delete the file token.json.
 SCOPES = [
     "https://www.googleapis.com/auth/calendar",
@@ -55,6 +69,7 @@ SCOPES = [
 
 # Timezone for events
 TIMEZONE = "America/New_York"  # EDT/EST timezone
+_UTC = datetime.timezone.utc
 
 # These variables will be loaded from a configuration file.
 SITE_DISPLAY_NAMES = {}
@@ -62,10 +77,93 @@ HIPCAMP_TO_CHECKFRONT = {}
 HIPCAMP_ICAL_URLS = {}
 CHECKFRONT_ICAL_URL = ""
 CHECKFRONT_HOST = ""
+# Derived from SITE_DISPLAY_NAMES when the configuration is loaded
+DISPLAY_NAME_TO_SITE = {}
 
 # Number of days in the past to sync events from
 SYNC_RANGE_DAYS = 90
 
+# Maximum number of iCal feeds downloaded at the same time
+MAX_FEED_WORKERS = 10
+
+# (connect, read) timeout in seconds for iCal and Checkfront requests, so a
+# stuck server fails fast instead of using up the whole Lambda run
+HTTP_TIMEOUT = (5, 15)
+
+# Name of the main Google Calendar that receives all bookings
+MAIN_CALENDAR_NAME = "DBR Camping"
+
+# How long a cached calendar ID lookup is trusted before re-listing
+CALENDAR_CACHE_TTL_HOURS = 24
+
+# Maximum number of requests in one Google batch HTTP request
+GOOGLE_BATCH_SIZE = 50
+
+# How often a Google API request that failed with a rate limit or server
+# error is retried, with exponential backoff, before giving up
+GOOGLE_API_RETRIES = 3
+
+# HTTP statuses of Google API errors worth retrying
+_RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Request methods that can be sent again without duplicating their effect
+_IDEMPOTENT_HTTP_METHODS = frozenset({"GET", "PUT", "PATCH", "DELETE"})
+
+# Largest page size accepted by events().list
+GOOGLE_LIST_MAX_RESULTS = 2500
+
+# Partial response mask for events().list, limited to what the sync reads
+GOOGLE_EVENT_LIST_FIELDS = (
+    "nextPageToken,nextSyncToken,"
+    "items(id,status,summary,description,start,end,extendedProperties/private)"
+)
+
+# Suffix appended to synced event summaries to show where they came from
+SOURCE_SUMMARY_SUFFIXES = {
+    "hipcamp": " Hipcamp",
+    "checkfront": " Checkfront",
+}
+
+# Upper bound in seconds for the daemon poll interval when nothing changes
+MAX_DAEMON_INTERVAL = 3600
+
+# VEVENT properties extracted from iCal feeds
+_ICAL_VEVENT_PROPERTIES = (
+    "DTSTART", "DTEND", "SUMMARY", "DESCRIPTION", "LOCATION", "URL", "UID"
+)
+# NAME;PARAM=value;PARAM="quoted:value":VALUE
+_ICAL_PROPERTY_RE = re.compile(
+    r'^([A-Za-z0-9-]+)((?:;[A-Za-z0-9-]+=(?:"[^"]*"|[^";:]*)(?:,(?:"[^"]*"|[^";:]*))*)*):(.*)$'
+)
+# YYYYMMDD or YYYYMMDDTHHMMSS[Z]
+_ICAL_DATE_RE = re.compile(r'^(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})(Z)?)?$')
+_ICAL_NAME_RE = re.compile(r'[A-Za-z0-9-]+')
+_ICAL_ESCAPE_RE = re.compile(r'\\(.)')
+
+# Booking ID and summary patterns applied to every feed event
+_HIPCAMP_BOOKING_ID_RE = re.compile(r"Booking ID: #(\d+)")
+_CHECKFRONT_NOTES_BOOKING_ID_RE = re.compile(r"HipCamp Booking ID: (\d+)")
+_CHECKFRONT_URL_BOOKING_ID_RE = re.compile(r'/booking/([^/]+)$')
+_PHONE_SUFFIX_RE = re.compile(r'\s*-\s*\+\d+.*$')
+_NON_ALPHANUMERIC_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Shared HTTP session so iCal fetches reuse keep-alive connections. It lives
+# at module level, so warm Lambda invocations reuse the open connections.
+# Transient feed errors are retried with a short backoff.
+_HTTP_SESSION = requests.Session()
+_HTTP_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_maxsize=MAX_FEED_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False
+    )
+)
+# Mount on both schemes so a plain http:// feed URL is pooled and retried too
+_HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+_HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+
 # The API client will be initialized inside run_sync, once credentials are loaded.
 checkfront = None
 
@@ -82,28 +180,36 @@ class Logger:
     def __init__(self, level: LogLevel = LogLevel.NORMAL):
         self.level = level
     
-    def log(self, message: str, level: LogLevel = LogLevel.NORMAL) -> None:
+    def is_enabled(self, level: LogLevel) -> bool:
+        """Check whether messages of the given level are emitted."""
+        return level.value <= self.level.value
+    
+    def log(self, message: str, *args, level: LogLevel = LogLevel.NORMAL) -> None:
         """
         Log a message if the current level is sufficient.
         
+        The message is only %-formatted with args when it is emitted, so
+        callers in hot loops can avoid building strings that are discarded.
+        
         Args:
-            message: Message to log
+            message: Message to log, optionally a %-format string
+            *args: Optional arguments for the format string
             level: Level of the message
         """
         if level.value <= self.level.value:
-            print(message)
+            print(message % args if args else message)
     
-    def normal(self, message: str) -> None:
+    def normal(self, message: str, *args) -> None:
         """Log a normal priority message."""
-        self.log(message, LogLevel.NORMAL)
+        self.log(message, *args, level=LogLevel.NORMAL)
     
-    def warn(self, message: str) -> None:
+    def warn(self, message: str, *args) -> None:
         """Log a warning priority message."""
-        self.log(message, LogLevel.WARN)
+        self.log(message, *args, level=LogLevel.WARN)
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Log a debug priority message."""
-        self.log(message, LogLevel.DEBUG)
+        self.log(message, *args, level=LogLevel.DEBUG)
 
 
 def parse_args() -> argparse.Namespace:
@@ -173,6 +279,44 @@ def format_event_date_for_logging(event) -> str:
     except Exception:
         return "(date error)"
 
+def _json_loads(data: Union[str, bytes]):
+    """Decode JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data) -> Union[str, bytes]:
+    """Encode data as compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data)
+
+
+def _read_json_file(path: str):
+    """
+    Read and decode a JSON file.
+    
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file does not contain valid JSON
+    """
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _write_json_file(path: str, data) -> None:
+    """
+    Encode data as JSON and write it to a file.
+    
+    Raises:
+        OSError: If the file cannot be written
+    """
+    encoded = _json_dumps(data)
+    with open(path, "wb" if isinstance(encoded, bytes) else "w") as f:
+        f.write(encoded)
+
+
 def load_site_configuration():
     """
     Load site display names, Checkfront mappings, and iCal URLs from a JSON file.
@@ -180,21 +324,13 @@ def load_site_configuration():
     falling back to 'site_configuration.json' in the CWD.
     """
     global SITE_DISPLAY_NAMES, HIPCAMP_TO_CHECKFRONT, HIPCAMP_ICAL_URLS
-    global CHECKFRONT_ICAL_URL, CHECKFRONT_HOST
+    global CHECKFRONT_ICAL_URL, CHECKFRONT_HOST, DISPLAY_NAME_TO_SITE
     
     config_path_env = os.environ.get("SITE_CONFIG_PATH")
     config_path = config_path_env or "site_configuration.json"
 
-    if not os.path.exists(config_path):
-        logger.warn(
-            f"WARN: Site configuration file not found at '{config_path}'. "
-            "Using empty configs."
-        )
-        return
-
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        config_data = _read_json_file(config_path)
         
         SITE_DISPLAY_NAMES = config_data.get("SITE_DISPLAY_NAMES", {})
         HIPCAMP_TO_CHECKFRONT = config_data.get("HIPCAMP_TO_CHECKFRONT", {})
@@ -202,10 +338,21 @@ def load_site_configuration():
         CHECKFRONT_ICAL_URL = config_data.get("CHECKFRONT_ICAL_URL", "")
         CHECKFRONT_HOST = config_data.get("CHECKFRONT_HOST", "")
         
+        # Reverse lookup used to map event summaries back to HipCamp sites.
+        # The first site wins if two share a display name.
+        DISPLAY_NAME_TO_SITE = {}
+        for site, display_name in SITE_DISPLAY_NAMES.items():
+            DISPLAY_NAME_TO_SITE.setdefault(display_name, site)
+        
         logger.debug(
             f"Successfully loaded site configuration from {config_path}"
         )
 
+    except FileNotFoundError:
+        logger.warn(
+            f"WARN: Site configuration file not found at '{config_path}'. "
+            "Using empty configs."
+        )
     except json.JSONDecodeError:
         logger.warn(
             f"ERROR: Could not decode JSON from {config_path}. "
@@ -228,11 +375,11 @@ def load_checkfront_credentials() -> Tuple[str, str]:
     creds_path_env = os.environ.get("CHECKFRONT_CREDENTIALS_PATH")
     path = creds_path_env or "checkfront_credentials.json"
     
-    logger.debug(f"Env var CHECKFRONT_CREDENTIALS_PATH: {creds_path_env}")
-    logger.debug(f"Attempting to load Checkfront credentials from: {path}")
+    logger.debug("Env var CHECKFRONT_CREDENTIALS_PATH: %s", creds_path_env)
+    logger.debug("Attempting to load Checkfront credentials from: %s", path)
 
-    with open(path, "r") as f:
-        credentials = json.load(f)
+    with open(path, "rb") as f:
+        credentials = _json_loads(f.read())
     return credentials["api_key"], credentials["api_secret"]
 
 class CalendarEvent:
@@ -249,6 +396,12 @@ class CalendarEvent:
         google_event_id: ID of the event in Google Calendar (if synced)
     """
     
+    # One instance is created per reservation, so skip the per-instance dict
+    __slots__ = (
+        "start_time", "end_time", "summary", "description",
+        "source", "source_id", "google_event_id",
+    )
+    
     def __init__(
         self,
         start_time: datetime.datetime,
@@ -282,8 +435,32 @@ class CheckfrontAPI:
         self.host = host
         self.api_key = api_key
         self.api_secret = api_secret
+        self.base_url = f"https://{host}/api/3.0/"
+        # Result of get_hipcamp_event_mapping, reused until bookings change
+        self._hipcamp_mapping: Optional[Dict[str, str]] = None
+        
+        # Encode the Basic auth header once; the session sends it (and
+        # reuses its keep-alive connections) on every request.
+        auth_string = f"{api_key}:{api_secret}"
+        base64_auth = base64.b64encode(auth_string.encode('ascii')).decode('ascii')
         self.session = requests.Session()
-        self.session.auth = (api_key, api_secret)
+        self.session.headers.update({
+            "Authorization": f"Basic {base64_auth}",
+            "Content-Type": "application/json"
+        })
+        # Back off and retry rate limited or failed requests. POSTs are not
+        # retried because they create bookings and events.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "DELETE"}),
+            raise_on_status=False
+        )
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(max_retries=retry)
+        )
     
     def _make_request(
         self,
@@ -305,42 +482,41 @@ class CheckfrontAPI:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        # Create base64 encoded auth string
-        auth_string = f"{self.api_key}:{self.api_secret}"
-        auth_bytes = auth_string.encode('ascii')
-        base64_auth = base64.b64encode(auth_bytes).decode('ascii')
-
-        headers = {
-            "Authorization": f"Basic {base64_auth}",
-            "Content-Type": "application/json"
-        }
-        
-        url = f"https://{self.host}/api/3.0/{endpoint}"
-        logger.debug(f"\nMaking {method} request to Checkfront API:")
-        logger.debug(f"URL: {url}")
-        logger.debug(f"Headers: {headers}")
-        if params:
-            logger.debug(f"Request Body: {json.dumps(params, indent=2)}")
-            
-        response = requests.request(
+        url = self.base_url + endpoint
+        # Only pretty-print payloads when they will actually be logged
+        debug = logger.is_enabled(LogLevel.DEBUG)
+        if debug:
+            logger.debug("\nMaking %s request to Checkfront API:", method)
+            logger.debug("URL: %s", url)
+            # Never log the Basic auth header, it holds the API credentials
+            headers = dict(self.session.headers)
+            if "Authorization" in headers:
+                headers["Authorization"] = "<redacted>"
+            logger.debug("Headers: %s", headers)
+            if params:
+                logger.debug("Request Body: %s", json.dumps(params, indent=2))
+            
+        # The session already sends the JSON Content-Type header
+        response = self.session.request(
             method,
             url,
-            headers=headers,
-            json=params if method == "POST" else None,
-            params=params if method != "POST" else None
+            data=_json_dumps(params) if method == "POST" and params is not None else None,
+            params=params if method != "POST" else None,
+            timeout=HTTP_TIMEOUT
         )
         
-        logger.debug(f"Response Status Code: {response.status_code}")
-        logger.debug(f"Response Headers: {dict(response.headers)}")
-        
-        try:
-            response_data = response.json()
-            logger.debug(f"Response Body: {json.dumps(response_data, indent=2)}")
-        except json.JSONDecodeError:
-            logger.debug(f"Response Body (raw): {response.text}")
+        if debug:
+            logger.debug("Response Status Code: %s", response.status_code)
+            logger.debug("Response Headers: %s", dict(response.headers))
+            
+            try:
+                response_data = response.json()
+                logger.debug("Response Body: %s", json.dumps(response_data, indent=2))
+            except json.JSONDecodeError:
+                logger.debug("Response Body (raw): %s", response.text)
             
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     def get_items(self) -> List[Dict]:
         """
@@ -382,20 +558,32 @@ class CheckfrontAPI:
         response = self._make_request("event", params=params)
         return response.get("events", [])
     
-    def get_hipcamp_event_mapping(self) -> Dict[str, str]:
+    def get_hipcamp_event_mapping(self, horizon_days: int = 365) -> Dict[str, str]:
         """
         Get a mapping of HipCamp booking IDs to Checkfront event IDs.
         The mapping is created by parsing the event names and notes.
         
+        The mapping is fetched once and reused by later calls on this client
+        (one per synced calendar and one per deleted HipCamp booking). It is
+        fetched again after a HipCamp booking is created, and deleted
+        bookings are dropped from it.
+        
+        Args:
+            horizon_days: How many days ahead to look for Checkfront events.
+                Only used when the mapping is fetched.
+        
         Returns:
-            Dictionary mapping HipCamp booking IDs to Checkfront event IDs
+            Dictionary mapping HipCamp booking IDs to Checkfront event IDs.
+            The dictionary is shared between calls and must not be modified.
             
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        # Get events for the next year
+        if self._hipcamp_mapping is not None:
+            return self._hipcamp_mapping
+        
         now = datetime.datetime.now()
-        end_date = (now + datetime.timedelta(days=365)).strftime("%Y-%m-%d")
+        end_date = (now + datetime.timedelta(days=horizon_days)).strftime("%Y-%m-%d")
         events = self.get_events(end_date=end_date)
         
         # Create mapping of HipCamp booking IDs to Checkfront event IDs
@@ -404,15 +592,16 @@ class CheckfrontAPI:
         for event in events:
             # Look for HipCamp booking ID in notes
             notes = event.get("notes", "")
-            match = re.search(r"HipCamp Booking ID: (\d+)", notes)
+            match = _CHECKFRONT_NOTES_BOOKING_ID_RE.search(notes)
             if match:
                 hipcamp_id = match.group(1)
                 hipcamp_mapping[hipcamp_id] = event.get("event_id")
                 logger.debug(
-                    f"Found Checkfront event {event.get('event_id')} "
-                    f"for HipCamp booking {hipcamp_id}"
+                    "Found Checkfront event %s for HipCamp booking %s",
+                    event.get('event_id'), hipcamp_id
                 )
         
+        self._hipcamp_mapping = hipcamp_mapping
         return hipcamp_mapping
     
     def create_unavailable_event(
@@ -442,13 +631,13 @@ class CheckfrontAPI:
             requests.exceptions.RequestException: If the API request fails
         """
         logger.debug("\nCreating Checkfront unavailable event:")
-        logger.debug(f"Name: {name}")
-        logger.debug(f"Start Date: {start_date}")
-        logger.debug(f"End Date: {end_date}")
-        logger.debug(f"Category ID: {category_id}")
-        logger.debug(f"Item ID: {item_id}")
+        logger.debug("Name: %s", name)
+        logger.debug("Start Date: %s", start_date)
+        logger.debug("End Date: %s", end_date)
+        logger.debug("Category ID: %s", category_id)
+        logger.debug("Item ID: %s", item_id)
         if notes:
-            logger.debug(f"Notes: {notes}")
+            logger.debug("Notes: %s", notes)
             
         data = {
             "start_date": start_date,
@@ -798,11 +987,7 @@ class CheckfrontAPI:
             site_display_name = event.summary.split(" - ", 1)[0]
             
             # Find the original HipCamp site name
-            hipcamp_site_name = None
-            for site, display_name in SITE_DISPLAY_NAMES.items():
-                if display_name == site_display_name:
-                    hipcamp_site_name = site
-                    break
+            hipcamp_site_name = DISPLAY_NAME_TO_SITE.get(site_display_name)
             
             if not hipcamp_site_name:
                 error_msg = f"Could not find HipCamp site for display name: {site_display_name}"
@@ -869,6 +1054,8 @@ class CheckfrontAPI:
                     f"Created Checkfront booking {booking_id} for {site_display_name} "
                     f"(HipCamp ID: {event.source_id}) {date_info}"
                 )
+                # The new booking is not in the cached mapping yet
+                self._hipcamp_mapping = None
             else:
                 logger.normal(
                     f"Failed to create Checkfront booking for {site_display_name} "
@@ -939,7 +1126,10 @@ class CheckfrontAPI:
                 f"for HipCamp booking {hipcamp_id}, deleting..."
             )
             
-            return self.delete_booking(checkfront_booking_id)
+            deleted = self.delete_booking(checkfront_booking_id)
+            if deleted:
+                hipcamp_mapping.pop(hipcamp_id, None)
+            return deleted
             
         except Exception as e:
             logger.normal(
@@ -960,13 +1150,25 @@ def get_site_display_name(site_name: str) -> str:
     return SITE_DISPLAY_NAMES.get(site_name, site_name)
 
 
-def get_google_credentials(force_refresh: bool = False) -> Credentials:
+# Credentials loaded in this process, keyed by (credentials path, token path)
+_CREDENTIALS_CACHE: Dict[Tuple[str, str], Credentials] = {}
+
+
+def get_google_credentials(
+    force_refresh: bool = False,
+    token_info: Optional[Dict] = None,
+    client_config: Optional[Dict] = None
+) -> Credentials:
     """
     Get Google Calendar API credentials.
     Handles token refresh and initial authentication.
     
     Args:
         force_refresh: If True, force a re-authentication.
+        token_info: Authorized user info to use instead of reading the
+            token file (e.g. loaded from a secrets store)
+        client_config: OAuth client configuration to use instead of reading
+            the credentials file for the first-time login
         
     Returns:
         Google Calendar API credentials
@@ -979,29 +1181,184 @@ def get_google_credentials(force_refresh: bool = False) -> Credentials:
     token_path = token_path_env or "token.json"
     credentials_path = creds_path_env or "google_credentials.json"
 
-    logger.debug(f"Env var GOOGLE_TOKEN_PATH: {token_path_env}")
-    logger.debug(f"Using Google token path: {token_path}")
-    logger.debug(f"Env var GOOGLE_CREDENTIALS_PATH: {creds_path_env}")
-    logger.debug(f"Using Google credentials path: {credentials_path}")
+    logger.debug("Env var GOOGLE_TOKEN_PATH: %s", token_path_env)
+    logger.debug("Using Google token path: %s", token_path)
+    logger.debug("Env var GOOGLE_CREDENTIALS_PATH: %s", creds_path_env)
+    logger.debug("Using Google credentials path: %s", credentials_path)
 
+    cache_key = (credentials_path, token_path)
+    if not force_refresh:
+        # Reuse credentials loaded earlier in this process (e.g. a warm
+        # Lambda container) instead of re-reading the token file.
+        creds = _CREDENTIALS_CACHE.get(cache_key)
+        if creds and creds.valid:
+            return creds
+    
     # The file token.json stores the user's access and refresh tokens
-    if not force_refresh and os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+    if not creds and not force_refresh and token_info is not None:
+        creds = Credentials.from_authorized_user_info(token_info, SCOPES)
+    elif not creds and not force_refresh:
+        try:
+            creds = Credentials.from_authorized_user_info(
+                _read_json_file(token_path), SCOPES
+            )
+        except FileNotFoundError:
+            pass  # No token yet, run the authorization flow below
     
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
         else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                credentials_path, SCOPES
-            )
+            # Only needed for the interactive first-time login, and it pulls
+            # in oauthlib, so keep it off the import path of normal runs.
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            if client_config is not None:
+                flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    credentials_path, SCOPES
+                )
             creds = flow.run_local_server(port=0)
         with open(token_path, "w") as token:
             token.write(creds.to_json())
-            
+    
+    _CREDENTIALS_CACHE[cache_key] = creds
     return creds
 
 
+@functools.lru_cache(maxsize=1)
+def get_calendar_service():
+    """
+    Build the Google Calendar API service once per process.
+    
+    The discovery document bundled with google-api-python-client is used
+    instead of fetching it over the network. The service keeps refreshing
+    its credentials as needed, so it can be reused across daemon cycles and
+    warm Lambda invocations.
+    
+    Returns:
+        Google Calendar API service instance
+    """
+    return build(
+        "calendar", "v3",
+        credentials=get_google_credentials(),
+        cache_discovery=False,
+        static_discovery=True
+    )
+
+
+def get_state_file_path(env_var: str, filename: str) -> str:
+    """
+    Get the path of a local state/cache file.
+    
+    The path can be overridden by an environment variable; otherwise the
+    file lives next to the Google token file (which is /tmp in Lambda).
+    
+    Args:
+        env_var: Environment variable that overrides the path
+        filename: File name used when no override is set
+        
+    Returns:
+        Path to the state file
+    """
+    path_env = os.environ.get(env_var)
+    if path_env:
+        return path_env
+    token_path = os.environ.get("GOOGLE_TOKEN_PATH") or "token.json"
+    return os.path.join(os.path.dirname(token_path), filename)
+
+
+def _list_calendar_ids(service) -> Dict[str, str]:
+    """
+    List the calendars used by the sync and map their names to IDs.
+    
+    Args:
+        service: Google Calendar API service instance
+        
+    Returns:
+        Dictionary mapping calendar names to calendar IDs
+    """
+    calendar_ids = {}
+    page_token = None
+    while True:
+        # Only the names and IDs are needed from each entry
+        calendar_list = service.calendarList().list(
+            pageToken=page_token, fields="nextPageToken,items(id,summary)"
+        ).execute(num_retries=GOOGLE_API_RETRIES)
+        for calendar_list_entry in calendar_list.get("items", []):
+            summary = calendar_list_entry["summary"]
+            # Keep the main calendar and site-specific calendars (e.g., "HT1 Checkfront")
+            if summary == MAIN_CALENDAR_NAME or summary.endswith(" Checkfront"):
+                calendar_ids[summary] = calendar_list_entry["id"]
+        page_token = calendar_list.get("nextPageToken")
+        if not page_token:
+            return calendar_ids
+
+
+# Calendar IDs resolved in this process, keyed by cache file path
+_RESOLVED_CALENDAR_IDS: Dict[str, Tuple[datetime.datetime, Dict[str, str]]] = {}
+
+
+def resolve_calendar_ids(service, cache_path: str) -> Dict[str, str]:
+    """
+    Resolve the IDs of the main and site-specific calendars.
+    
+    The result of the calendarList lookup is cached in a JSON file. A cached
+    entry is validated with a cheap calendars().get call on the main calendar
+    and the full list is only requested again on a cache miss, a 404 or when
+    the cache is older than CALENDAR_CACHE_TTL_HOURS (so newly created site
+    calendars are still picked up).
+    
+    Once resolved, the IDs are also kept in memory for the same TTL, so later
+    syncs in the same process (warm Lambda invocations, daemon cycles) skip
+    both the cache file and the validation request.
+    
+    Args:
+        service: Google Calendar API service instance
+        cache_path: Path to the calendar ID cache file
+        
+    Returns:
+        Dictionary mapping calendar names to calendar IDs
+    """
+    now = datetime.datetime.now(_UTC)
+    ttl = datetime.timedelta(hours=CALENDAR_CACHE_TTL_HOURS)
+    resolved = _RESOLVED_CALENDAR_IDS.get(cache_path)
+    if resolved and now - resolved[0] < ttl:
+        return resolved[1]
+    
+    try:
+        cache = _read_json_file(cache_path)
+        fetched_at = datetime.datetime.fromisoformat(cache["fetched_at"])
+        calendar_ids = cache["calendars"]
+        
+        main_calendar_id = calendar_ids.get(MAIN_CALENDAR_NAME)
+        if main_calendar_id and now - fetched_at < ttl:
+            service.calendars().get(
+                calendarId=main_calendar_id, fields="id"
+            ).execute(num_retries=GOOGLE_API_RETRIES)
+            logger.debug("Using cached calendar IDs from %s", cache_path)
+            # Keep the file's age so the TTL isn't restarted per process
+            _RESOLVED_CALENDAR_IDS[cache_path] = (fetched_at, calendar_ids)
+            return calendar_ids
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or unreadable cache, fall through to a full list
+    except HttpError as error:
+        if error.resp.status != 404:
+            raise
+        logger.warn("Cached calendar ID is no longer valid, re-listing calendars")
+    
+    calendar_ids = _list_calendar_ids(service)
+    _RESOLVED_CALENDAR_IDS[cache_path] = (now, calendar_ids)
+    try:
+        _write_json_file(cache_path, {
+            "fetched_at": now.isoformat(),
+            "calendars": calendar_ids
+        })
+    except OSError as e:
+        logger.warn(f"WARN: Could not write calendar ID cache {cache_path}: {e}")
+    return calendar_ids
+
+
 def extract_booking_id(description: str) -> Optional[str]:
     """
     Extract the booking ID from the HipCamp event description.
@@ -1012,277 +1369,763 @@ def extract_booking_id(description: str) -> Optional[str]:
     Returns:
         The booking ID if found, None otherwise
     """
-    if not description:
+    # Cheap substring check first, most descriptions lack the marker
+    if not description or "Booking ID: #" not in description:
         return None
         
-    match = re.search(r"Booking ID: #(\d+)", description)
+    match = _HIPCAMP_BOOKING_ID_RE.search(description)
     if match:
         return match.group(1)
     return None
 
 
-def fetch_hipcamp_events() -> List[CalendarEvent]:
-    """
-    Fetch events from all HipCamp iCal feeds and convert them to CalendarEvent objects.
+def _unfold_ical_lines(lines: Iterable[str]) -> Iterator[str]:
     """
-    all_events = []
-    # Add cache-busting headers to ensure we get fresh data
-    headers = {
-        'Cache-Control': 'no-cache, no-store, must-revalidate',
-        'Pragma': 'no-cache',
-        'Expires': '0'
-    }
+    Join RFC 5545 folded lines (continuations start with a space or tab).
     
-    for site_name, url in HIPCAMP_ICAL_URLS.items():
-        if not url:  # Skip if URL is not set
-            continue
-            
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            # Parse the iCal data
-            cal = Calendar.from_ical(response.text)
-            
-            for event in cal.walk("VEVENT"):
-                # Get the booking ID from the description
-                description = str(event.get("description", ""))
-                booking_id = extract_booking_id(description)
-                
-                if not booking_id:
-                    continue  # Skip events without booking IDs
-                
-                # Get dates
-                start_date = event.get("dtstart").dt
-                end_date = event.get("dtend").dt
-                
-                # Convert to datetime if they're date objects
-                if isinstance(start_date, vDate):
-                    start_time = datetime.datetime.combine(
-                        start_date, datetime.time(14, 0)  # 2:00 PM check-in
-                    )
-                else:
-                    start_time = start_date
-                    
-                if isinstance(end_date, vDate):
-                    end_time = datetime.datetime.combine(
-                        end_date, datetime.time(12, 0)  # 12:00 PM check-out
-                    )
-                else:
-                    end_time = end_date
-                
-                # Get guest info from description and clean it up
-                guest_info = description.split("\n")[0] if description else ""
-                # Remove phone number if present
-                guest_info = re.sub(r'\s*-\s*\+\d+.*$', '', guest_info)
-                
-                # Create the event
-                display_name = get_site_display_name(site_name)
-                event = CalendarEvent(
-                    start_time=start_time,
-                    end_time=end_time,
-                    summary=f"{display_name} - {guest_info}",
-                    description=description,
-                    source="hipcamp",
-                    source_id=booking_id
-                )
-                all_events.append(event)
-                
-        except requests.exceptions.RequestException as e:
-            logger.normal(f"Error fetching events for {site_name}: {e}")
+    Args:
+        lines: Raw iCal lines, with or without line endings
+        
+    Yields:
+        Unfolded content lines
+    """
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if current is not None and line[:1] in (" ", "\t"):
+            current += line[1:]
             continue
-            
-    return all_events
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
 
 
-def get_google_calendar_events(
-    service,
-    calendar_id: str,
-    start_time: datetime.datetime
-) -> List[CalendarEvent]:
+@functools.lru_cache(maxsize=32)
+def _get_zoneinfo(tzid: str) -> ZoneInfo:
+    """Look up a time zone by TZID, caching the result since feeds repeat it."""
+    return ZoneInfo(tzid)
+
+
+def _parse_ical_date_value(
+    value: str,
+    params: Dict[str, str]
+) -> Union[datetime.date, datetime.datetime]:
     """
-    Fetch events from Google Calendar and convert them to CalendarEvent objects.
+    Parse an iCal DATE or DATE-TIME value the same way icalendar's .dt does.
     
     Args:
-        service: Google Calendar API service instance
-        calendar_id: ID of the calendar to fetch events from
-        start_time: Start time to fetch events from
+        value: The property value (e.g. 20240101 or 20240101T140000Z)
+        params: The property parameters (VALUE, TZID)
         
     Returns:
-        List of CalendarEvent objects
+        A date for DATE values, otherwise a (possibly timezone-aware) datetime
         
     Raises:
-        HttpError: If the Google Calendar API request fails
+        ValueError: If the value is not a valid DATE or DATE-TIME
     """
-    try:
-        events_result = (
-            service.events()
-            .list(
-                calendarId=calendar_id,
-                timeMin=start_time.isoformat(),
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
-        )
+    if len(value) == 8 and value.isdigit():
+        # Plain DATE, the common case for booking feeds
+        return datetime.date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    
+    match = _ICAL_DATE_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid iCal date value: {value}")
+    year, month, day, hour, minute, second, utc = match.groups()
+    
+    if hour is None:
+        return datetime.date(int(year), int(month), int(day))
+    
+    tzinfo = None
+    if utc:
+        tzinfo = _UTC
+    elif "TZID" in params:
+        tzinfo = _get_zoneinfo(params["TZID"])
+    return datetime.datetime(
+        int(year), int(month), int(day),
+        int(hour), int(minute), int(second),
+        tzinfo=tzinfo
+    )
+
+
+def _unescape_ical_match(match) -> str:
+    """Replacement for an escaped character in an iCal TEXT value."""
+    return "\n" if match.group(1) in "nN" else match.group(1)
+
+
+def _iter_vevents(lines: Iterable[str]) -> Iterator[Dict]:
+    """
+    Scan iCal lines and yield the VEVENT properties the sync uses.
+    
+    Only DTSTART, DTEND, SUMMARY, DESCRIPTION, LOCATION, URL and UID are
+    extracted; all other properties and sub-components are skipped without
+    being decoded.
+    
+    Args:
+        lines: iCal feed lines
         
-        events = []
-        for event in events_result.get("items", []):
-            # Get the source ID from extended properties if it exists
-            source = "google_calendar"
-            source_id = None
-            
-            if "extendedProperties" in event:
-                private_props = event["extendedProperties"].get("private", {})
-                if "hipcamp_booking_id" in private_props:
-                    source = "hipcamp"
-                    source_id = private_props["hipcamp_booking_id"]
-                elif "checkfront_booking_id" in private_props:
-                    source = "checkfront"
-                    source_id = private_props["checkfront_booking_id"]
-            
-            # Handle both all-day and timed events
-            start = event["start"].get("dateTime", event["start"].get("date"))
-            end = event["end"].get("dateTime", event["end"].get("date"))
-            
-            # Convert to datetime, handling both date and datetime formats
-            if "T" in start:  # This is a datetime
-                start_time = datetime.datetime.fromisoformat(start)
-            else:  # This is a date
-                start_time = datetime.datetime.fromisoformat(f"{start}T00:00:00")
-                
-            if "T" in end:  # This is a datetime
-                end_time = datetime.datetime.fromisoformat(end)
-            else:  # This is a date
-                end_time = datetime.datetime.fromisoformat(f"{end}T00:00:00")
-            
-            calendar_event = CalendarEvent(
-                start_time=start_time,
-                end_time=end_time,
-                summary=event["summary"],
-                description=event.get("description"),
-                source=source,
-                source_id=source_id,
-                google_event_id=event["id"]
-            )
-            events.append(calendar_event)
-            
-        return events
+    Yields:
+        A dict per VEVENT keyed by lower-case property name. Dates are
+        date/datetime objects, text values are unescaped strings.
         
-    except HttpError as error:
-        logger.warn(f"An error occurred: {error}")
-        return []
+    Raises:
+        ValueError: If a property line or date value cannot be parsed
+    """
+    event = None
+    depth = 0
+    for line in _unfold_ical_lines(lines):
+        if line == "BEGIN:VEVENT":
+            event = {}
+            depth = 0
+            continue
+        if event is None:
+            continue
+        if line == "END:VEVENT":
+            yield event
+            event = None
+            continue
+        if line.startswith("BEGIN:"):
+            depth += 1  # e.g. VALARM, its properties are not the event's
+            continue
+        if line.startswith("END:"):
+            depth -= 1
+            continue
+        if depth:
+            continue
+        
+        # Check the property name before running the full line pattern, so
+        # properties the sync does not use are skipped cheaply
+        name_match = _ICAL_NAME_RE.match(line)
+        if name_match and name_match.group(0).upper() not in _ICAL_VEVENT_PROPERTIES:
+            continue
+        
+        match = _ICAL_PROPERTY_RE.match(line)
+        if not match:
+            raise ValueError(f"Invalid iCal content line: {line[:80]}")
+        name, raw_params, value = match.groups()
+        name = name.upper()
+        
+        params = {}
+        for param in raw_params.split(";")[1:]:
+            key, _, param_value = param.partition("=")
+            params[key.upper()] = param_value.strip('"')
+        
+        if name in ("DTSTART", "DTEND"):
+            event[name.lower()] = _parse_ical_date_value(value, params)
+        elif name in ("URL", "UID"):
+            event[name.lower()] = value
+        else:
+            event[name.lower()] = _ICAL_ESCAPE_RE.sub(_unescape_ical_match, value)
 
 
-def extract_checkfront_booking_id(url: str) -> Optional[str]:
+def _parse_ical_events_with_icalendar(text: str) -> List[Dict]:
+    """Parse VEVENTs with the icalendar library into the _iter_vevents format."""
+    events = []
+    for component in Calendar.from_ical(text).walk("VEVENT"):
+        event = {}
+        for name in _ICAL_VEVENT_PROPERTIES:
+            prop = component.get(name)
+            if prop is None:
+                continue
+            if name in ("DTSTART", "DTEND"):
+                event[name.lower()] = prop.dt
+            else:
+                event[name.lower()] = str(prop)
+        events.append(event)
+    return events
+
+
+def parse_ical_events(text: str) -> List[Dict]:
     """
-    Extract the booking ID from the Checkfront event URL.
+    Parse the VEVENTs of an iCal feed.
+    
+    A line scanner extracts just the properties the sync needs, which avoids
+    building icalendar's full component tree. Feeds the scanner cannot handle
+    are parsed with icalendar instead. Setting the ICAL_PARSER environment
+    variable to "icalendar" always uses icalendar, to compare the results.
     
     Args:
-        url: The event URL from Checkfront
+        text: The iCal feed text
         
     Returns:
-        The booking ID if found, None otherwise
+        List of event dicts (see _iter_vevents)
     """
-    if not url:
-        logger.warn("Error: Empty URL provided to extract_checkfront_booking_id")
-        return None
-        
-    logger.debug(f"Processing Checkfront URL: {url}")
-    match = re.search(r'/booking/([^/]+)$', url)
-    if match:
-        booking_id = match.group(1)
-        logger.debug(f"Found Checkfront booking ID: {booking_id}")
-        return booking_id
+    if os.environ.get("ICAL_PARSER", "").lower() == "icalendar":
+        return _parse_ical_events_with_icalendar(text)
     
-    logger.warn(f"Error: Could not extract booking ID from URL: {url}")
-    return None
+    try:
+        return list(_iter_vevents(io.StringIO(text)))
+    except (ValueError, KeyError) as e:
+        # KeyError covers unknown TZIDs (ZoneInfoNotFoundError)
+        logger.warn(f"WARN: Fast iCal parse failed ({e}), falling back to icalendar")
+        return _parse_ical_events_with_icalendar(text)
 
 
-def fetch_checkfront_events() -> List[CalendarEvent]:
+def fetch_ical_text(url: str, skip_unchanged_body: bool = False) -> Optional[str]:
     """
-    Fetch events from Checkfront iCal feed and convert them to CalendarEvent objects.
-    """
-    all_events = []
+    Download an iCal feed, revalidating a locally cached copy if there is one.
     
-    # Debug: Log Checkfront iCal URL
-    logger.debug(f"🔍 CHECKFRONT DEBUG: Fetching from URL: {CHECKFRONT_ICAL_URL}")
+    The feed body and its ETag/Last-Modified validators are cached in the
+    iCal cache directory. Later requests send If-None-Match/If-Modified-Since,
+    and a 304 Not Modified response is answered from the cached body, so an
+    unchanged feed costs a round trip without a body transfer.
     
-    # Add cache-busting headers to ensure we get fresh data
+    Args:
+        url: The iCal feed URL
+        skip_unchanged_body: If True, return None on 304 Not Modified instead
+            of reading the cached body (the caller already has it parsed)
+        
+    Returns:
+        The iCal feed text, or None if the feed is unchanged and
+        skip_unchanged_body is set
+        
+    Raises:
+        requests.exceptions.RequestException: If the feed request fails
+    """
+    # Add cache-busting headers to ensure intermediaries revalidate with the origin
     headers = {
         'Cache-Control': 'no-cache, no-store, must-revalidate',
         'Pragma': 'no-cache',
         'Expires': '0'
     }
     
+    cache_dir = get_state_file_path("ICAL_CACHE_DIR", "ical_cache")
+    cache_key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    meta_path = os.path.join(cache_dir, f"{cache_key}.json")
+    body_path = os.path.join(cache_dir, f"{cache_key}.ics")
+    
+    conditional_headers = {}
     try:
-        response = requests.get(CHECKFRONT_ICAL_URL, headers=headers)
-        response.raise_for_status()
+        validators = _read_json_file(meta_path)
+        if validators.get("etag"):
+            conditional_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = validators["last_modified"]
+    except (OSError, ValueError):
+        pass  # No usable cache entry, do a plain GET
+    
+    response = _HTTP_SESSION.get(
+        url, headers={**headers, **conditional_headers}, timeout=HTTP_TIMEOUT
+    )
+    logger.debug("Fetched %s: HTTP %s", url, response.status_code)
+    
+    if response.status_code == 304:
+        if skip_unchanged_body:
+            return None
+        try:
+            with open(body_path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            # Validators without a body, fetch the feed again unconditionally
+            response = _HTTP_SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+    
+    response.raise_for_status()
+    # iCal is UTF-8 (RFC 5545). Decode the body directly unless the server
+    # names a charset, rather than letting requests default text/calendar to
+    # ISO-8859-1 or run charset detection over the whole feed.
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        text = response.text
+    else:
+        text = response.content.decode("utf-8", errors="replace")
+    
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(body_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            _write_json_file(meta_path, {"etag": etag, "last_modified": last_modified})
+        except OSError as e:
+            logger.warn(f"WARN: Could not cache iCal feed {url}: {e}")
+    
+    return text
+
+
+# Parsed VEVENTs of the feeds downloaded in this process, keyed by URL, with
+# the SHA-256 digest of the body they were parsed from
+_PARSED_FEEDS: Dict[str, Tuple[str, List[Dict]]] = {}
+
+
+def fetch_ical_events(url: str) -> List[Dict]:
+    """
+    Download and parse an iCal feed, reusing earlier parse results.
+    
+    When the feed is unchanged since it was last parsed in this process
+    (warm Lambda invocations, daemon cycles) the server answers 304 and the
+    previously parsed events are returned without reading or parsing a body.
+    Servers that send no validators always return the full body; if it
+    hashes to the same digest as the last parsed body, the parse is skipped
+    as well. The returned dicts are shared between calls and must not be
+    modified.
+    
+    Args:
+        url: The iCal feed URL
         
-        # Debug: Log response details
-        logger.debug(f"🔍 CHECKFRONT DEBUG: Response status: {response.status_code}")
-        logger.debug(f"🔍 CHECKFRONT DEBUG: Response size: {len(response.text)} characters")
-        logger.debug(f"🔍 CHECKFRONT DEBUG: Response headers: {dict(response.headers)}")
+    Returns:
+        List of VEVENT dicts as returned by parse_ical_events
         
-        # Parse the iCal data
-        cal = Calendar.from_ical(response.text)
+    Raises:
+        requests.exceptions.RequestException: If the feed request fails
+    """
+    cached = _PARSED_FEEDS.get(url)
+    text = fetch_ical_text(url, skip_unchanged_body=cached is not None)
+    if text is None:
+        logger.debug("Feed unchanged, reusing parsed events for %s", url)
+        return cached[1]
+    
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    if cached is not None and cached[0] == digest:
+        logger.debug("Feed body unchanged, reusing parsed events for %s", url)
+        return cached[1]
+    
+    events = parse_ical_events(text)
+    _PARSED_FEEDS[url] = (digest, events)
+    return events
+
+
+def _fetch_hipcamp_feed(site_name: str, url: str) -> List[CalendarEvent]:
+    """
+    Fetch a single HipCamp iCal feed and convert it to CalendarEvent objects.
+    
+    Args:
+        site_name: The HipCamp site name the feed belongs to
+        url: The iCal feed URL
         
-        # Debug: Log calendar parsing
-        logger.debug(f"🔍 CHECKFRONT DEBUG: Parsed calendar with {len(cal.walk('VEVENT'))} events")
+    Returns:
+        List of CalendarEvent objects for the site
         
-        for event in cal.walk("VEVENT"):
-            # Get the booking ID from the URL
-            url = str(event.get("url", ""))
-            booking_id = extract_checkfront_booking_id(url)
-            
-            if not booking_id:
-                continue  # Skip events without booking IDs
-            
-            # Get dates
-            start_date = event.get("dtstart").dt
-            end_date = event.get("dtend").dt
-            
-            # Convert to datetime if they're date objects
-            if isinstance(start_date, vDate):
-                start_time = datetime.datetime.combine(
-                    start_date, datetime.time(14, 0)  # 2:00 PM check-in
-                )
-            else:
-                start_time = start_date
-                
-            if isinstance(end_date, vDate):
-                end_time = datetime.datetime.combine(
-                    end_date, datetime.time(12, 0)  # 12:00 PM check-out
-                )
-            else:
-                end_time = end_date
+    Raises:
+        requests.exceptions.RequestException: If the feed request fails
+    """
+    events = []
+    # Share one string object between events with identical descriptions
+    description_pool: Dict[str, str] = {}
+    # The display name is the same for every event in the feed
+    display_name = get_site_display_name(site_name)
+    for event in fetch_ical_events(url):
+        # Get the booking ID from the description
+        description = event.get("description", "")
+        description = description_pool.setdefault(description, description)
+        booking_id = extract_booking_id(description)
+        
+        if not booking_id:
+            continue  # Skip events without booking IDs
+        
+        # Get dates; all-day bookings stay plain dates, which
+        # normalize_datetime treats as midnight UTC
+        start_time = event["dtstart"]
+        end_time = event["dtend"]
+        
+        # Get guest info from description and clean it up
+        guest_info = description.split("\n")[0] if description else ""
+        # Remove phone number if present
+        guest_info = _PHONE_SUFFIX_RE.sub('', guest_info)
+        
+        # Create the event
+        events.append(CalendarEvent(
+            start_time=start_time,
+            end_time=end_time,
+            summary=f"{display_name} - {guest_info}",
+            description=description,
+            source="hipcamp",
+            source_id=booking_id
+        ))
+        
+    return events
+
+
+def fetch_hipcamp_events(
+    failed_sources: Optional[Set[str]] = None
+) -> List[CalendarEvent]:
+    """
+    Fetch events from all HipCamp iCal feeds and convert them to CalendarEvent objects.
+    
+    The feeds are downloaded concurrently, so the total fetch time is roughly
+    that of the slowest feed rather than the sum of all of them. A feed that
+    fails is logged and skipped, so the other feeds are still synced.
+    
+    Args:
+        failed_sources: Optional set that "hipcamp" is added to if any feed
+            could not be fetched
+        
+    Returns:
+        List of CalendarEvent objects from the feeds that could be fetched
+    """
+    feeds = [
+        (site_name, url)
+        for site_name, url in HIPCAMP_ICAL_URLS.items()
+        if url  # Skip if URL is not set
+    ]
+    if not feeds:
+        return []
+    
+    all_events = []
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_FEED_WORKERS, len(feeds))
+    ) as executor:
+        futures = [
+            (site_name, executor.submit(_fetch_hipcamp_feed, site_name, url))
+            for site_name, url in feeds
+        ]
+        # Collect in configuration order so the result is deterministic
+        for site_name, future in futures:
+            try:
+                all_events.extend(future.result())
+            except requests.exceptions.RequestException as e:
+                logger.normal(f"Error fetching events for {site_name}: {e}")
+                if failed_sources is not None:
+                    failed_sources.add("hipcamp")
+            
+    return all_events
+
+
+def _parse_gcal_dt(value: str) -> datetime.datetime:
+    """
+    Parse a Google Calendar start/end value into a datetime.
+    
+    Args:
+        value: Either a date (YYYY-MM-DD) for all-day events or an
+            RFC 3339 dateTime for timed events
+        
+    Returns:
+        The datetime, at midnight for all-day events
+    """
+    if len(value) == 10:  # This is a date
+        return datetime.datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    return datetime.datetime.fromisoformat(value)
+
+
+def _google_item_ends_after(item: Dict, start_time: datetime.datetime) -> bool:
+    """
+    Check whether a Google Calendar event resource ends after a given time.
+    
+    Args:
+        item: Event resource returned by the Google Calendar API
+        start_time: Timezone-aware time to compare against
+        
+    Returns:
+        True if the event ends after start_time; False if it ends earlier
+        or has no end
+    """
+    end = item.get("end") or {}
+    value = end.get("dateTime") or end.get("date")
+    if not value:
+        return False
+    return normalize_datetime(_parse_gcal_dt(value)) > start_time
+
+
+def _google_item_to_event(item: Dict) -> CalendarEvent:
+    """
+    Convert a Google Calendar event resource to a CalendarEvent.
+    
+    Args:
+        item: Event resource returned by the Google Calendar API
+        
+    Returns:
+        CalendarEvent object
+    """
+    # Get the source ID from extended properties if it exists
+    source = "google_calendar"
+    source_id = None
+    
+    if "extendedProperties" in item:
+        private_props = item["extendedProperties"].get("private", {})
+        if "hipcamp_booking_id" in private_props:
+            source = "hipcamp"
+            source_id = private_props["hipcamp_booking_id"]
+        elif "checkfront_booking_id" in private_props:
+            source = "checkfront"
+            source_id = private_props["checkfront_booking_id"]
+    
+    # Handle both all-day and timed events
+    start = item["start"].get("dateTime", item["start"].get("date"))
+    end = item["end"].get("dateTime", item["end"].get("date"))
+    
+    return CalendarEvent(
+        start_time=_parse_gcal_dt(start),
+        end_time=_parse_gcal_dt(end),
+        summary=item.get("summary", ""),
+        description=item.get("description"),
+        source=source,
+        source_id=source_id,
+        google_event_id=item["id"]
+    )
+
+
+def _list_google_event_items(service, **list_params) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Page through events().list and collect every returned event resource.
+    
+    Args:
+        service: Google Calendar API service instance
+        **list_params: Parameters passed to events().list
+        
+    Returns:
+        A tuple of the event resources and the nextSyncToken (if returned)
+        
+    Raises:
+        HttpError: If the Google Calendar API request fails
+    """
+    items = []
+    page_token = None
+    while True:
+        response = service.events().list(
+            pageToken=page_token,
+            maxResults=GOOGLE_LIST_MAX_RESULTS,
+            fields=GOOGLE_EVENT_LIST_FIELDS,
+            **list_params
+        ).execute(num_retries=GOOGLE_API_RETRIES)
+        items.extend(response.get("items", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            # The sync token is only returned with the last page
+            return items, response.get("nextSyncToken")
+
+
+def _load_sync_state(sync_state_path: str) -> Dict:
+    """Load the incremental sync state file, returning an empty state if missing."""
+    try:
+        return _read_json_file(sync_state_path)
+    except (OSError, ValueError):
+        return {}
+
+
+def _sync_google_event_items(
+    service,
+    calendar_id: str,
+    sync_state_path: str
+) -> List[Dict]:
+    """
+    Fetch Google Calendar events incrementally using a sync token.
+    
+    A local mirror of the calendar's events is kept in the sync state file
+    together with the last nextSyncToken. Subsequent runs only download the
+    events that changed since the previous run and apply them to the mirror.
+    If Google reports the token as expired (410 Gone), a full sync is done.
+    
+    A full sync cannot be limited to a time window, so it downloads the
+    calendar's entire history. That happens on the first run and whenever
+    the state file is gone, which is why run_sync only uses this mode when
+    a state file path is configured.
+    
+    Args:
+        service: Google Calendar API service instance
+        calendar_id: ID of the calendar to fetch events from
+        sync_state_path: Path to the sync state file
+        
+    Returns:
+        List of event resources currently in the calendar
+        
+    Raises:
+        HttpError: If the Google Calendar API request fails
+    """
+    state = _load_sync_state(sync_state_path)
+    calendar_state = state.get(calendar_id, {})
+    sync_token = calendar_state.get("sync_token")
+    mirror = calendar_state.get("items", {})
+    
+    changes = None
+    if sync_token:
+        try:
+            changes, sync_token = _list_google_event_items(
+                service,
+                calendarId=calendar_id,
+                singleEvents=True,
+                syncToken=sync_token,
+            )
+            logger.debug("Incremental sync returned %s changed events", len(changes))
+        except HttpError as error:
+            if error.resp.status != 410:
+                raise
+            logger.warn("Google sync token expired, doing a full sync")
+    
+    if changes is None:
+        # Full sync. timeMin/orderBy cannot be combined with sync tokens,
+        # so the whole calendar is mirrored and filtered locally.
+        changes, sync_token = _list_google_event_items(
+            service,
+            calendarId=calendar_id,
+            singleEvents=True,
+        )
+        mirror = {}
+        logger.debug("Full sync returned %s events", len(changes))
+    
+    for item in changes:
+        if item.get("status") == "cancelled":
+            mirror.pop(item["id"], None)
+        else:
+            mirror[item["id"]] = {
+                key: item[key]
+                for key in ("id", "summary", "description", "start", "end", "extendedProperties")
+                if key in item
+            }
+    
+    if sync_token:
+        state[calendar_id] = {"sync_token": sync_token, "items": mirror}
+        try:
+            _write_json_file(sync_state_path, state)
+        except OSError as e:
+            logger.warn(f"WARN: Could not write sync state {sync_state_path}: {e}")
+    
+    return list(mirror.values())
+
+
+def get_google_calendar_events(
+    service,
+    calendar_id: str,
+    start_time: datetime.datetime,
+    sync_state_path: Optional[str] = None
+) -> List[CalendarEvent]:
+    """
+    Fetch events from Google Calendar and convert them to CalendarEvent objects.
+    
+    Args:
+        service: Google Calendar API service instance
+        calendar_id: ID of the calendar to fetch events from
+        start_time: Start time to fetch events from
+        sync_state_path: Optional path to a sync state file. When given, only
+            the events changed since the last run are downloaded. Without an
+            existing state file the whole calendar history is downloaded
+            once (see _sync_google_event_items) and filtered locally.
+        
+    Returns:
+        List of CalendarEvent objects
+        
+    Raises:
+        HttpError: If the Google Calendar API request fails
+    """
+    try:
+        if sync_state_path:
+            items = _sync_google_event_items(service, calendar_id, sync_state_path)
+        else:
+            items, _ = _list_google_event_items(
+                service,
+                calendarId=calendar_id,
+                timeMin=start_time.isoformat(),
+                singleEvents=True,
+                orderBy="startTime"
+            )
+        
+        if not sync_state_path:
+            return [_google_item_to_event(item) for item in items]
+        
+        # Apply the same window timeMin would have applied (end after
+        # start_time) to the raw items, so events outside it are never
+        # converted
+        events = [
+            _google_item_to_event(item) for item in items
+            if _google_item_ends_after(item, start_time)
+        ]
+        events.sort(key=lambda event: normalize_datetime(event.start_time))
+        return events
+        
+    except HttpError as error:
+        logger.warn(f"An error occurred: {error}")
+        return []
+
+
+def extract_checkfront_booking_id(url: str) -> Optional[str]:
+    """
+    Extract the booking ID from the Checkfront event URL.
+    
+    Args:
+        url: The event URL from Checkfront
+        
+    Returns:
+        The booking ID if found, None otherwise
+    """
+    if not url:
+        logger.warn("Error: Empty URL provided to extract_checkfront_booking_id")
+        return None
+        
+    logger.debug("Processing Checkfront URL: %s", url)
+    match = _CHECKFRONT_URL_BOOKING_ID_RE.search(url)
+    if match:
+        booking_id = match.group(1)
+        logger.debug("Found Checkfront booking ID: %s", booking_id)
+        return booking_id
+    
+    logger.warn(f"Error: Could not extract booking ID from URL: {url}")
+    return None
+
+
+def fetch_checkfront_events(
+    failed_sources: Optional[Set[str]] = None
+) -> List[CalendarEvent]:
+    """
+    Fetch events from Checkfront iCal feed and convert them to CalendarEvent objects.
+    
+    Args:
+        failed_sources: Optional set that "checkfront" is added to if the
+            feed could not be fetched
+        
+    Returns:
+        List of CalendarEvent objects, empty if the feed could not be fetched
+    """
+    all_events = []
+    # Share one string object between events with identical text
+    string_pool: Dict[str, str] = {}
+    
+    # Debug: Log Checkfront iCal URL
+    logger.debug("🔍 CHECKFRONT DEBUG: Fetching from URL: %s", CHECKFRONT_ICAL_URL)
+    
+    try:
+        # Download and parse the iCal data
+        vevents = fetch_ical_events(CHECKFRONT_ICAL_URL)
+        
+        # Debug: Log calendar parsing
+        logger.debug("🔍 CHECKFRONT DEBUG: Parsed calendar with %s events", len(vevents))
+        
+        for event in vevents:
+            # Get the booking ID from the URL
+            url = event.get("url", "")
+            booking_id = extract_checkfront_booking_id(url)
+            
+            if not booking_id:
+                continue  # Skip events without booking IDs
+            
+            # Get dates; all-day bookings stay plain dates, which
+            # normalize_datetime treats as midnight UTC
+            start_time = event["dtstart"]
+            end_time = event["dtend"]
             
             # Get guest info and location
-            guest_info = str(event.get("summary", ""))
+            guest_info = event.get("summary", "")
             
             # Debug: Log event details being processed
-            logger.debug(f"🔍 CHECKFRONT DEBUG: Processing event - Summary: '{guest_info}', Location: '{event.get('location', 'N/A')}', Booking ID: {booking_id}")
+            logger.debug(
+                "🔍 CHECKFRONT DEBUG: Processing event - Summary: '%s', Location: '%s', Booking ID: %s",
+                guest_info, event.get('location', 'N/A'), booking_id
+            )
             
             # Skip events that were created from HipCamp bookings
             if "(HipCamp)" in guest_info:
-                logger.debug(f"Skipping Checkfront event from HipCamp: {guest_info}")
+                logger.debug("Skipping Checkfront event from HipCamp: %s", guest_info)
                 continue
                 
-            location = str(event.get("location", ""))
+            location = event.get("location", "")
             
             # Clean up location name to match HipCamp format
             # Extract just the site code (e.g., "HT2" from "HT2 - HillTop Site#2")
             location = location.split("- ")[0].strip()
+            location = string_pool.setdefault(location, location)
+            description = event.get("description", "")
+            description = string_pool.setdefault(description, description)
             
             # Debug: Log processed event
-            logger.debug(f"🔍 CHECKFRONT DEBUG: Created event - Location: '{location}', Guest: '{guest_info}', Dates: {start_time} to {end_time}")
+            logger.debug(
+                "🔍 CHECKFRONT DEBUG: Created event - Location: '%s', Guest: '%s', Dates: %s to %s",
+                location, guest_info, start_time, end_time
+            )
             
             # Create the event
             event = CalendarEvent(
                 start_time=start_time,
                 end_time=end_time,
                 summary=f"{location} - {guest_info}",
-                description=str(event.get("description", "")),
+                description=description,
                 source="checkfront",
                 source_id=booking_id
             )
@@ -1290,11 +2133,13 @@ def fetch_checkfront_events() -> List[CalendarEvent]:
             
     except requests.exceptions.RequestException as e:
         logger.normal(f"Error fetching events from Checkfront: {e}")
+        if failed_sources is not None:
+            failed_sources.add("checkfront")
     
     # Debug: Log final result
-    logger.debug(f"🔍 CHECKFRONT DEBUG: Final result - {len(all_events)} events created")
+    logger.debug("🔍 CHECKFRONT DEBUG: Final result - %s events created", len(all_events))
     for i, event in enumerate(all_events[:3]):  # Show first 3 events
-        logger.debug(f"🔍 CHECKFRONT DEBUG: Event {i+1}: {event.summary} (ID: {event.source_id})")
+        logger.debug("🔍 CHECKFRONT DEBUG: Event %s: %s (ID: %s)", i+1, event.summary, event.source_id)
         
     return all_events
 
@@ -1315,11 +2160,7 @@ def create_checkfront_event(event: CalendarEvent) -> Optional[str]:
         site_display_name = event.summary.split(" - ", 1)[0]
         
         # Find the original HipCamp site name
-        hipcamp_site_name = None
-        for site, display_name in SITE_DISPLAY_NAMES.items():
-            if display_name == site_display_name:
-                hipcamp_site_name = site
-                break
+        hipcamp_site_name = DISPLAY_NAME_TO_SITE.get(site_display_name)
         
         if not hipcamp_site_name:
             logger.warn(
@@ -1377,17 +2218,62 @@ def normalize_datetime(
     Returns:
         Timezone-aware datetime object
     """
-    if isinstance(dt, datetime.date) and not isinstance(dt, datetime.datetime):
+    if not isinstance(dt, datetime.datetime):
         # Convert date to datetime at midnight UTC
-        dt = datetime.datetime.combine(dt, datetime.time(0, 0))
+        return datetime.datetime(dt.year, dt.month, dt.day, tzinfo=_UTC)
     
     if dt.tzinfo is None:
         # Add UTC timezone if no timezone is set
-        dt = dt.replace(tzinfo=datetime.timezone.utc)
+        dt = dt.replace(tzinfo=_UTC)
         
     return dt
 
 
+def format_event_date(value: Union[datetime.date, datetime.datetime]) -> str:
+    """
+    Format the date of an event boundary as YYYY-MM-DD.
+    
+    The ISO form of both dates and datetimes starts with the date, so slicing
+    isoformat() avoids strftime's format string parsing.
+    
+    Args:
+        value: Date or datetime to format
+        
+    Returns:
+        The date in YYYY-MM-DD format
+    """
+    return value.isoformat()[:10]
+
+
+def _dedup_events(events: List[CalendarEvent]) -> List[CalendarEvent]:
+    """
+    Remove duplicate events, keeping the first occurrence.
+    
+    Events are identified by (source, source_id). Events without a source ID
+    fall back to a hash of their start, end and summary.
+    
+    Args:
+        events: List of events, possibly containing duplicates
+        
+    Returns:
+        List of unique events in their original order
+    """
+    seen: Dict[Union[tuple, bytes], CalendarEvent] = {}
+    for event in events:
+        if event.source_id:
+            key = (event.source, event.source_id)
+        else:
+            key = hashlib.blake2b(
+                f"{event.start_time}|{event.end_time}|{event.summary}".encode(),
+                digest_size=16
+            ).digest()
+        seen.setdefault(key, event)
+    
+    if len(seen) != len(events):
+        logger.debug("Removed %s duplicate events", len(events) - len(seen))
+    return list(seen.values())
+
+
 def _extract_customer_info_from_hipcamp_event(event: CalendarEvent) -> Dict[str, str]:
     """Extracts customer information from a HipCamp event description."""
     customer_info = {}
@@ -1411,19 +2297,208 @@ def _extract_customer_info_from_hipcamp_event(event: CalendarEvent) -> Dict[str,
         customer_info["email"] = email
     else:
         # Create sanitized email from name
-        sanitized_name = re.sub(r'[^a-zA-Z0-9]', '', name.lower())
+        sanitized_name = _NON_ALPHANUMERIC_RE.sub('', name.lower())
         customer_info["email"] = f"{sanitized_name}@example.com"
         
     return customer_info
 
 
+def _event_patch_body(google_event: Dict, existing_event: CalendarEvent) -> Dict:
+    """
+    Collect the fields of a planned event body that differ from Google.
+    
+    Args:
+        google_event: Full event body built from the source event
+        existing_event: The event currently in Google Calendar
+        
+    Returns:
+        Body for events().patch with only the changed fields; empty if the
+        event is unchanged
+    """
+    patch_body = {}
+    if google_event["summary"] != existing_event.summary:
+        patch_body["summary"] = google_event["summary"]
+    # Google omits empty descriptions
+    if (google_event["description"] or "") != (existing_event.description or ""):
+        patch_body["description"] = google_event["description"]
+    if google_event["start"]["date"] != format_event_date(existing_event.start_time):
+        patch_body["start"] = google_event["start"]
+    if google_event["end"]["date"] != format_event_date(existing_event.end_time):
+        patch_body["end"] = google_event["end"]
+    # The source booking ID is already set, otherwise the events wouldn't
+    # have matched; only a newly created Checkfront booking is added.
+    # Patching merges it into the existing private properties.
+    checkfront_id = google_event["extendedProperties"]["private"].get(
+        "checkfront_booking_id"
+    )
+    if checkfront_id:
+        patch_body["extendedProperties"] = {
+            "private": {"checkfront_booking_id": checkfront_id}
+        }
+    return patch_body
+
+
+def _create_checkfront_booking_for_hipcamp_event(
+    event: CalendarEvent,
+    hipcamp_to_checkfront: Dict[str, str]
+) -> Optional[str]:
+    """
+    Create a Checkfront booking for a HipCamp event that doesn't have one.
+    
+    Args:
+        event: HipCamp calendar event
+        hipcamp_to_checkfront: Mapping of HipCamp booking IDs to existing
+            Checkfront bookings
+        
+    Returns:
+        The new Checkfront booking ID, or None if the event already has a
+        booking or none could be created
+    """
+    source_id = event.source_id
+    logger.debug("🔍 SYNC DEBUG: Checking if HipCamp event %s needs Checkfront booking", source_id)
+    logger.debug("🔍 SYNC DEBUG: Current mapping has %d entries", len(hipcamp_to_checkfront))
+    logger.debug("🔍 SYNC DEBUG: HipCamp ID %s in mapping: %s", source_id, source_id in hipcamp_to_checkfront)
+    
+    if source_id in hipcamp_to_checkfront:
+        logger.debug("🔍 SYNC DEBUG: HipCamp event %s already has Checkfront booking, skipping creation", source_id)
+        return None
+    
+    logger.debug("Creating new Checkfront booking for HipCamp event %s (not found in existing mapping)", source_id)
+    # Extract customer info from event description
+    customer_info = _extract_customer_info_from_hipcamp_event(event)
+    
+    # Create Checkfront booking
+    checkfront_id = checkfront.create_hipcamp_booking(event, customer_info)
+    if checkfront_id:
+        logger.normal(
+            f"Created Checkfront booking: {checkfront_id} "
+            f"for HipCamp booking {source_id} {format_event_date_for_logging(event)}"
+        )
+    return checkfront_id
+
+
+def _http_error_has_reason(error: HttpError, status: int, *reasons: str) -> bool:
+    """
+    Check the status and error reasons of a Google API error.
+    
+    Args:
+        error: The HttpError raised or passed to a batch callback
+        status: HTTP status the error must have
+        *reasons: Accepted error reasons (e.g. "insufficientPermissions")
+        
+    Returns:
+        True if the error has the status and one of the reasons
+    """
+    if error.resp.status != status:
+        return False
+    details = getattr(error, "error_details", None)
+    if isinstance(details, list):
+        return any(
+            isinstance(detail, dict) and detail.get("reason") in reasons
+            for detail in details
+        )
+    # No structured details (e.g. a non-JSON body), look in the raw body
+    content = error.content or b""
+    return any(reason.encode("utf-8") in content for reason in reasons)
+
+
+def _is_retryable_error(error: Optional[Exception]) -> bool:
+    """
+    Check whether a Google API request failed with a transient error.
+    
+    Args:
+        error: The exception a request failed with, or None
+        
+    Returns:
+        True for rate limit and server errors
+    """
+    return isinstance(error, HttpError) and (
+        error.resp.status in _RETRYABLE_HTTP_STATUSES
+        or _http_error_has_reason(
+            error, 403, "rateLimitExceeded", "userRateLimitExceeded"
+        )
+    )
+
+
+def _execute_batched(
+    service,
+    requests_to_send: List
+) -> List[Tuple[Optional[Dict], Optional[Exception]]]:
+    """
+    Execute Google Calendar API requests using batch HTTP requests.
+    
+    Requests are sent GOOGLE_BATCH_SIZE at a time in a single multipart
+    HTTP round trip each, instead of one round trip per request. Patches
+    and deletes that fail with a rate limit or server error are sent again
+    in a new batch, up to GOOGLE_API_RETRIES times with jittered exponential
+    backoff. Inserts are not retried: Google may have created the event
+    despite the error, and a second insert would duplicate it. A delete
+    answered with 404 or 410 counts as successful, since the event is gone
+    (possibly removed by an earlier attempt).
+    
+    Args:
+        service: Google Calendar API service instance
+        requests_to_send: List of unexecuted API requests
+        
+    Returns:
+        A (response, exception) tuple for each request, in the same order
+    """
+    results: List[Tuple[Optional[Dict], Optional[Exception]]] = [
+        (None, None)
+    ] * len(requests_to_send)
+    
+    def _callback(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+    
+    pending = list(range(len(requests_to_send)))
+    for attempt in range(GOOGLE_API_RETRIES + 1):
+        if attempt:
+            delay = min(16, 2 ** (attempt - 1)) + random.random()
+            logger.warn(
+                "WARN: Retrying %s failed Google API requests in %.1fs",
+                len(pending), delay
+            )
+            time.sleep(delay)
+        
+        for chunk_start in range(0, len(pending), GOOGLE_BATCH_SIZE):
+            chunk = pending[chunk_start:chunk_start + GOOGLE_BATCH_SIZE]
+            batch = service.new_batch_http_request(callback=_callback)
+            for index in chunk:
+                batch.add(requests_to_send[index], request_id=str(index))
+            try:
+                batch.execute()
+            except HttpError as error:
+                # The whole batch failed, report the error for every request in it
+                for index in chunk:
+                    results[index] = (None, error)
+        
+        pending = [
+            index for index in pending
+            if _is_retryable_error(results[index][1])
+            and requests_to_send[index].method in _IDEMPOTENT_HTTP_METHODS
+        ]
+        if not pending:
+            break
+    
+    for index, (_, error) in enumerate(results):
+        if (
+            isinstance(error, HttpError)
+            and error.resp.status in (404, 410)
+            and requests_to_send[index].method == "DELETE"
+        ):
+            results[index] = (None, None)
+    
+    return results
+
+
 def sync_events_to_calendar(
     service,
     calendar_id: str,
     hipcamp_events: List[CalendarEvent],
     checkfront_events: List[CalendarEvent],
-    existing_events: List[CalendarEvent]
-) -> None:
+    existing_events: List[CalendarEvent],
+    failed_sources: Optional[Set[str]] = None
+) -> int:
     """
     Sync HipCamp and Checkfront events to Google Calendar.
     
@@ -1439,23 +2514,29 @@ def sync_events_to_calendar(
         hipcamp_events: List of current HipCamp events
         checkfront_events: List of current Checkfront events
         existing_events: List of existing Google Calendar events
+        failed_sources: Sources whose feeds could not be fetched. Their
+            events are missing from the lists above because of the failure,
+            not because they were cancelled, so none of them are deleted.
+        
+    Returns:
+        Number of Google Calendar events that were created, updated or deleted
         
     Raises:
         HttpError: If any Google Calendar API operation fails
     """
     # Get current time in UTC
-    now = datetime.datetime.now(datetime.timezone.utc)
+    now = datetime.datetime.now(_UTC)
     
     # Debug: Log sync parameters
-    logger.debug(f"🔍 SYNC DEBUG: Calendar ID: {calendar_id}")
-    logger.debug(f"🔍 SYNC DEBUG: HipCamp events: {len(hipcamp_events)}")
-    logger.debug(f"🔍 SYNC DEBUG: Checkfront events: {len(checkfront_events)}")
-    logger.debug(f"🔍 SYNC DEBUG: Existing events: {len(existing_events)}")
-    logger.debug(f"🔍 SYNC DEBUG: Current time: {now}")
+    logger.debug("🔍 SYNC DEBUG: Calendar ID: %s", calendar_id)
+    logger.debug("🔍 SYNC DEBUG: HipCamp events: %s", len(hipcamp_events))
+    logger.debug("🔍 SYNC DEBUG: Checkfront events: %s", len(checkfront_events))
+    logger.debug("🔍 SYNC DEBUG: Existing events: %s", len(existing_events))
+    logger.debug("🔍 SYNC DEBUG: Current time: %s", now)
     
     # Get mapping of HipCamp events to Checkfront events
     hipcamp_to_checkfront = checkfront.get_hipcamp_event_mapping()
-    logger.debug(f"🔍 SYNC DEBUG: HipCamp to Checkfront mapping: {len(hipcamp_to_checkfront)} entries")
+    logger.debug("🔍 SYNC DEBUG: HipCamp to Checkfront mapping: %s entries", len(hipcamp_to_checkfront))
     
     # Create a map of existing events by source and ID
     existing_events_map: Dict[tuple, CalendarEvent] = {}
@@ -1463,124 +2544,95 @@ def sync_events_to_calendar(
     google_event_ids: Dict[tuple, str] = {}
     
     for event in existing_events:
-        if event.source_id:
-            key = (event.source, event.source_id)
-            existing_events_map[key] = event
-            if event.google_event_id:
-                google_event_ids[key] = event.google_event_id
-                # Log existing event IDs for debugging
-                if event.source == "hipcamp":
-                    cf_id = None
-                    if "extendedProperties" in event.__dict__:
-                        private_props = (
-                            event.extendedProperties.get("private", {})
-                        )
-                        cf_id = (
-                            private_props.get("checkfront_booking_id")
-                            or private_props.get("checkfront_event_id")
-                        )
-                    logger.debug(
-                        f"Existing HipCamp event - ID: {event.source_id}, "
-                        f"Checkfront ID: {cf_id}"
-                    )
-                elif event.source == "checkfront":
-                    logger.debug(f"Existing Checkfront event - ID: {event.source_id}")
-    
-    # Create maps of new events by source and ID
-    new_hipcamp_events = {
-        ("hipcamp", event.source_id): event
-        for event in hipcamp_events
-        if event.source_id and normalize_datetime(event.end_time) > now
-    }
+        source_id = event.source_id
+        if not source_id:
+            continue  # Not created by this script, nothing to match against
+        key = (event.source, source_id)
+        existing_events_map[key] = event
+        google_event_id = event.google_event_id
+        if not google_event_id:
+            continue
+        google_event_ids[key] = google_event_id
+        
+        # Log existing event IDs for debugging
+        if event.source == "hipcamp":
+            logger.debug("Existing HipCamp event - ID: %s", source_id)
+        elif event.source == "checkfront":
+            logger.debug("Existing Checkfront event - ID: %s", source_id)
+    
+    # Map the current and future events of both sources by source and ID in
+    # a single pass; HipCamp events come first
+    new_events: Dict[tuple, CalendarEvent] = {}
+    for source, source_events in (
+        ("hipcamp", hipcamp_events), ("checkfront", checkfront_events)
+    ):
+        events_before = len(new_events)
+        for event in source_events:
+            source_id = event.source_id
+            if source_id and normalize_datetime(event.end_time) > now:
+                new_events[(source, source_id)] = event
+        
+        # Debug: Log event processing
+        logger.debug(
+            "🔍 SYNC DEBUG: New %s events: %s",
+            source, len(new_events) - events_before
+        )
     
-    new_checkfront_events = {
-        ("checkfront", event.source_id): event
-        for event in checkfront_events
-        if event.source_id and normalize_datetime(event.end_time) > now
-    }
+    logger.debug("🔍 SYNC DEBUG: Total new events: %s", len(new_events))
     
-    # Combine all new events
-    new_events = {**new_hipcamp_events, **new_checkfront_events}
+    # Debug: Show some event details
+    for (source, event_id), event in itertools.islice(new_events.items(), 3):
+        logger.debug(
+            "🔍 SYNC DEBUG: Processing %s event - ID: %s, Summary: '%s'",
+            source, event_id, event.summary
+        )
     
-    # Debug: Log event processing
-    logger.debug(f"🔍 SYNC DEBUG: New HipCamp events: {len(new_hipcamp_events)}")
-    logger.debug(f"🔍 SYNC DEBUG: New Checkfront events: {len(new_checkfront_events)}")
-    logger.debug(f"🔍 SYNC DEBUG: Total new events: {len(new_events)}")
+    # Plan all Google Calendar mutations first so they can be sent in batches.
+    # Each operation is (action, key, event, summary, google_event, request).
+    operations = []
     
-    # Debug: Show some event details
-    for source, event_id in list(new_events.keys())[:3]:
-        event = new_events[(source, event_id)]
-        logger.debug(f"🔍 SYNC DEBUG: Processing {source} event - ID: {event_id}, Summary: '{event.summary}'")
-    
-    # Delete events that no longer exist in either source
-    for key, event in existing_events_map.items():
-        if key not in new_events:
-            # Don't delete events that are already in the past
-            if normalize_datetime(event.end_time) <= now:
-                logger.debug(
-                    f"Skipping deletion of past event: {event.summary} "
-                    f"(ended {event.end_time})"
-                )
-                continue
+    # Delete events that no longer exist in either source. The key views
+    # give the stale keys as a single set difference.
+    for key in existing_events_map.keys() - new_events.keys():
+        event = existing_events_map[key]
+        if failed_sources and key[0] in failed_sources:
+            logger.debug(
+                "Skipping deletion of %s event, its feed failed: %s",
+                key[0], event.summary
+            )
+            continue
+        # Don't delete events that are already in the past
+        if normalize_datetime(event.end_time) <= now:
+            logger.debug(
+                "Skipping deletion of past event: %s (ended %s)",
+                event.summary, event.end_time
+            )
+            continue
 
-            try:
-                google_event_id = google_event_ids.get(key)
-                if google_event_id:
-                    service.events().delete(
-                        calendarId=calendar_id,
-                        eventId=google_event_id
-                    ).execute()
-                    if event.source == "hipcamp":
-                        date_info = format_event_date_for_logging(event)
-                        logger.normal(
-                            f"Deleted HipCamp event: {event.summary} "
-                            f"(ID: {event.source_id}) {date_info}"
-                        )
-                        # Also delete the associated Checkfront booking
-                        if event.source_id and checkfront:
-                            try:
-                                checkfront.delete_hipcamp_booking(event.source_id)
-                            except Exception as e:
-                                logger.warn(
-                                    f"Error deleting Checkfront booking for "
-                                    f"HipCamp ID {event.source_id}: {e}"
-                                )
-                    else:
-                        date_info = format_event_date_for_logging(event)
-                        logger.normal(
-                            f"Deleted Checkfront event: {event.summary} "
-                            f"(ID: {event.source_id}) {date_info}"
-                        )
-            except HttpError as error:
-                if "insufficientPermissions" in str(error):
-                    logger.warn(
-                        "Error: Insufficient permissions to delete events. "
-                        "Please check your Google Calendar API scopes and "
-                        "ensure you have write access to the calendar."
-                    )
-                else:
-                    logger.warn(f"Error deleting event: {error}")
+        google_event_id = google_event_ids.get(key)
+        if google_event_id:
+            operations.append((
+                "delete", key, event, event.summary, None,
+                service.events().delete(
+                    calendarId=calendar_id,
+                    eventId=google_event_id
+                )
+            ))
     
     # Create or update events
     for key, event in new_events.items():
+        # Events that have already ended were filtered out above
         source, source_id = key
         
-        # Skip events that have already ended
-        if normalize_datetime(event.end_time) <= now:
-            logger.debug(
-                f"Skipping past event: {event.summary} "
-                f"(ended: {event.end_time})"
-            )
-            continue
-        
         # Format dates for all-day events (YYYY-MM-DD)
-        start_date = event.start_time.strftime("%Y-%m-%d")
-        end_date = event.end_time.strftime("%Y-%m-%d")
+        start_date = format_event_date(event.start_time)
+        end_date = format_event_date(event.end_time)
         
         # Add source to summary if not already present
         summary = event.summary
-        if not summary.endswith(f" {source.capitalize()}"):
-            summary = f"{summary} {source.capitalize()}"
+        summary_suffix = SOURCE_SUMMARY_SUFFIXES[source]
+        if not summary.endswith(summary_suffix):
+            summary = f"{summary}{summary_suffix}"
         
         google_event = {
             "summary": summary,
@@ -1601,149 +2653,122 @@ def sync_events_to_calendar(
             }
         }
         
-        try:
-            if key in existing_events_map:
-                # Update existing event using Google Calendar event ID
-                google_event_id = google_event_ids.get(key)
-                if google_event_id:
-                    service.events().update(
+        # Create the Checkfront booking for a HipCamp reservation that
+        # doesn't have one yet before the Google write, so its ID goes out
+        # with the insert/update instead of a second update afterwards.
+        if source == "hipcamp":
+            checkfront_id = _create_checkfront_booking_for_hipcamp_event(
+                event, hipcamp_to_checkfront
+            )
+            if checkfront_id:
+                google_event["extendedProperties"][
+                    "private"
+                ]["checkfront_booking_id"] = checkfront_id
+        
+        existing_event = existing_events_map.get(key)
+        if existing_event is not None:
+            # Only send the fields that changed; nothing to write if the
+            # event already has the same content
+            patch_body = _event_patch_body(google_event, existing_event)
+            if not patch_body:
+                logger.debug("Skipping unchanged event: %s", summary)
+                continue
+            
+            # Update existing event using Google Calendar event ID
+            google_event_id = google_event_ids.get(key)
+            if google_event_id:
+                operations.append((
+                    "update", key, event, summary, patch_body,
+                    service.events().patch(
                         calendarId=calendar_id,
                         eventId=google_event_id,
-                        body=google_event
-                    ).execute()
-                    if source == "hipcamp":
-                        # Get the original event to extract date info
-                        original_event = None
-                        for event_list in [hipcamp_events, checkfront_events]:
-                            for evt in event_list:
-                                if hasattr(evt, 'source_id') and evt.source_id == source_id:
-                                    original_event = evt
-                                    break
-                            if original_event:
-                                break
-                        
-                        date_info = format_event_date_for_logging(original_event) if original_event else ""
-                        logger.normal(
-                            f"Updated HipCamp event: {summary} "
-                            f"(ID: {source_id}) {date_info}"
-                        )
-                        # Check if we need to create/update Checkfront booking
-                        # Only create if this is a new HipCamp event that doesn't already have a Checkfront booking
-                        logger.debug(f"🔍 SYNC DEBUG: Checking if HipCamp event {source_id} needs Checkfront booking")
-                        logger.debug(f"🔍 SYNC DEBUG: Current mapping has {len(hipcamp_to_checkfront)} entries")
-                        logger.debug(f"🔍 SYNC DEBUG: HipCamp ID {source_id} in mapping: {source_id in hipcamp_to_checkfront}")
-                        
-                        if source_id not in hipcamp_to_checkfront:
-                            logger.debug(f"Creating new Checkfront booking for HipCamp event {source_id} (not found in existing mapping)")
-                            # Extract customer info from event description
-                            customer_info = _extract_customer_info_from_hipcamp_event(event)
-                            
-                            # Create Checkfront booking
-                            checkfront_id = checkfront.create_hipcamp_booking(
-                                event,
-                                customer_info
-                            )
-                            if checkfront_id:
-                                logger.normal(
-                                    f"Created Checkfront booking: {checkfront_id} "
-                                    f"for HipCamp booking {source_id} {date_info}"
-                                )
-                                # Update the event with the Checkfront booking ID
-                                google_event["extendedProperties"][
-                                    "private"
-                                ]["checkfront_booking_id"] = checkfront_id
-                                service.events().update(
-                                    calendarId=calendar_id,
-                                    eventId=google_event_id,
-                                    body=google_event
-                                ).execute()
-                                logger.debug(
-                                    f"Linked HipCamp booking {source_id} "
-                                    f"with Checkfront booking {checkfront_id}"
-                                )
-                        else:
-                            logger.debug(f"🔍 SYNC DEBUG: HipCamp event {source_id} already has Checkfront booking, skipping creation")
-                    else:
-                        # Get the original event to extract date info
-                        original_event = None
-                        for event_list in [hipcamp_events, checkfront_events]:
-                            for evt in event_list:
-                                if hasattr(evt, 'source_id') and evt.source_id == source_id:
-                                    original_event = evt
-                                    break
-                            if original_event:
-                                break
-                        
-                        date_info = format_event_date_for_logging(original_event) if original_event else ""
-                        logger.normal(
-                            f"Updated Checkfront event: {summary} "
-                            f"(ID: {source_id}) {date_info}"
-                        )
-            else:
-                # Create new event
-                created_event = service.events().insert(
+                        body=patch_body
+                    )
+                ))
+        else:
+            # Create new event
+            operations.append((
+                "insert", key, event, summary, google_event,
+                service.events().insert(
                     calendarId=calendar_id,
                     body=google_event
-                ).execute()
-                if source == "hipcamp":
-                    date_info = format_event_date_for_logging(event)
-                    logger.normal(
-                        f"Created HipCamp event: {summary} "
-                        f"(ID: {source_id}) {date_info}"
-                    )
-                    # Create Checkfront booking for new HipCamp event
-                    # Extract customer info from event description
-                    customer_info = _extract_customer_info_from_hipcamp_event(event)
-                    
-                    # Create Checkfront booking
-                    checkfront_id = checkfront.create_hipcamp_booking(
-                        event,
-                        customer_info
-                    )
-                    if checkfront_id:
-                        logger.normal(
-                            f"Created Checkfront booking: {checkfront_id} "
-                            f"for HipCamp booking {source_id} {date_info}"
-                        )
-                        # Update the event with the Checkfront booking ID
-                        google_event["extendedProperties"][
-                            "private"
-                        ]["checkfront_booking_id"] = checkfront_id
-                        service.events().update(
-                            calendarId=calendar_id,
-                            eventId=created_event["id"],
-                            body=google_event
-                        ).execute()
-                        logger.debug(
-                            f"Linked HipCamp booking {source_id} "
-                            f"with Checkfront booking {checkfront_id}"
-                        )
-                else:
-                    date_info = format_event_date_for_logging(event)
-                    logger.normal(
-                        f"Created Checkfront event: {summary} "
-                        f"(ID: {source_id}) {date_info}"
-                    )
-                # Store the Google Calendar ID for future updates
-                google_event_ids[key] = created_event["id"]
-                        
-        except HttpError as error:
-            if "insufficientPermissions" in str(error):
+                )
+            ))
+    
+    results = _execute_batched(
+        service, [operation[-1] for operation in operations]
+    )
+    
+    # Only writes Google accepted count as changes
+    changes = 0
+    for (action, key, event, summary, google_event, _), (response, error) in zip(
+        operations, results
+    ):
+        source, source_id = key
+        
+        if error is not None:
+            if isinstance(error, HttpError) and _http_error_has_reason(
+                error, 403, "insufficientPermissions"
+            ):
                 logger.warn(
-                    "Error: Insufficient permissions to modify events. "
+                    "Error: Insufficient permissions to "
+                    f"{'delete' if action == 'delete' else 'modify'} events. "
                     "Please check your Google Calendar API scopes and "
                     "ensure you have write access to the calendar."
                 )
+            elif action == "delete":
+                logger.warn(f"Error deleting event: {error}")
             else:
                 logger.warn(f"Error syncing event: {error}")
+            continue
+        
+        changes += 1
+        date_info = format_event_date_for_logging(event)
+        
+        if action == "delete":
+            if source == "hipcamp":
+                logger.normal(
+                    f"Deleted HipCamp event: {event.summary} "
+                    f"(ID: {source_id}) {date_info}"
+                )
+                # Also delete the associated Checkfront booking
+                if source_id and checkfront:
+                    try:
+                        checkfront.delete_hipcamp_booking(source_id)
+                    except Exception as e:
+                        logger.warn(
+                            f"Error deleting Checkfront booking for "
+                            f"HipCamp ID {source_id}: {e}"
+                        )
+            else:
+                logger.normal(
+                    f"Deleted Checkfront event: {event.summary} "
+                    f"(ID: {source_id}) {date_info}"
+                )
+            continue
+        
+        if action == "insert":
+            # Store the Google Calendar ID for future updates
+            google_event_ids[key] = response["id"]
+        
+        logger.normal(
+            f"{'Created' if action == 'insert' else 'Updated'} "
+            f"{'HipCamp' if source == 'hipcamp' else 'Checkfront'} event: "
+            f"{summary} (ID: {source_id}) {date_info}"
+        )
+    
+    return changes
 
 
-def run_sync():
+def run_sync() -> int:
     """
     Main synchronization function.
     
     Initializes credentials, fetches events from all sources,
     and syncs them to the Google Calendar.
+    
+    Returns:
+        Number of Google Calendar events that were created, updated or deleted
     """
     # Load all configurations first
     load_site_configuration()
@@ -1757,74 +2782,96 @@ def run_sync():
         api_secret
     )
     
-    # Get Google Calendar service
-    logger.normal("Authenticating with Google Calendar...")
-    service = build("calendar", "v3", credentials=get_google_credentials())
-    
-    # --- Main Logic ---
-    # Get the ID of the main DBR Camping calendar
-    dbr_calendar_id = None
-    site_calendars = {}
-    
-    calendar_list = service.calendarList().list().execute()
-    for calendar_list_entry in calendar_list["items"]:
-        if calendar_list_entry["summary"] == "DBR Camping":
-            dbr_calendar_id = calendar_list_entry["id"]
-        # Check for site-specific calendars (e.g., "HT1 Checkfront")
-        elif calendar_list_entry["summary"].endswith(" Checkfront"):
-            site_code = calendar_list_entry["summary"].split(" ")[0]
-            site_calendars[site_code] = calendar_list_entry["id"]
-    
-    if not dbr_calendar_id:
-        logger.normal("Main 'DBR Camping' calendar not found.")
-        return
-
-    logger.normal(f"Found main calendar: DBR Camping (ID: {dbr_calendar_id})")
-    logger.normal(f"Found {len(site_calendars)} site-specific calendars.")
-
-    # Get existing events from Google Calendar
-    now = datetime.datetime.now(datetime.timezone.utc)
-    start_time = now - datetime.timedelta(days=SYNC_RANGE_DAYS)
-    
-    logger.normal("Fetching existing events from Google Calendar...")
-    google_events = get_google_calendar_events(
-        service, dbr_calendar_id, start_time
-    )
-    logger.normal(f"Found {len(google_events)} events in Google Calendar")
+    # The iCal feeds live on servers independent of Google, so download
+    # them in the background while we authenticate and list the calendar.
+    # A feed that fails doesn't stop the sync; its source is recorded so
+    # its events aren't deleted from the calendars.
+    failed_sources: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hipcamp_future = executor.submit(fetch_hipcamp_events, failed_sources)
+        checkfront_future = executor.submit(fetch_checkfront_events, failed_sources)
+        
+        # Get Google Calendar service
+        logger.normal("Authenticating with Google Calendar...")
+        service = get_calendar_service()
+        
+        # --- Main Logic ---
+        # Get the ID of the main DBR Camping calendar
+        calendar_ids = resolve_calendar_ids(
+            service,
+            get_state_file_path("CALENDAR_ID_CACHE_PATH", "calendar_id_cache.json")
+        )
+        dbr_calendar_id = calendar_ids.get(MAIN_CALENDAR_NAME)
+        # Site-specific calendars (e.g., "HT1 Checkfront")
+        site_calendars = {
+            summary.split(" ")[0]: calendar_id
+            for summary, calendar_id in calendar_ids.items()
+            if summary.endswith(" Checkfront")
+        }
+        
+        if not dbr_calendar_id:
+            logger.normal(f"Main '{MAIN_CALENDAR_NAME}' calendar not found.")
+            return 0
+
+        logger.normal(f"Found main calendar: {MAIN_CALENDAR_NAME} (ID: {dbr_calendar_id})")
+        logger.normal(f"Found {len(site_calendars)} site-specific calendars.")
+
+        # Get existing events from Google Calendar
+        now = datetime.datetime.now(_UTC)
+        start_time = now - datetime.timedelta(days=SYNC_RANGE_DAYS)
+        # Incremental sync is opt-in (--sync-state or GOOGLE_SYNC_STATE_PATH).
+        # Its first full sync downloads the whole calendar history and keeps
+        # a copy of it on disk, which only pays off where the state file
+        # survives between runs; by default the SYNC_RANGE_DAYS window is
+        # listed instead.
+        sync_state_path = os.environ.get("GOOGLE_SYNC_STATE_PATH") or None
+        
+        logger.normal("Fetching existing events from Google Calendar...")
+        google_events = get_google_calendar_events(
+            service, dbr_calendar_id, start_time, sync_state_path
+        )
+        
+        # The same reservation can show up more than once across feeds
+        hipcamp_events = _dedup_events(hipcamp_future.result())
+        checkfront_events = _dedup_events(checkfront_future.result())
     
-    # Get HipCamp events
-    hipcamp_events = fetch_hipcamp_events()
+    if failed_sources:
+        logger.warn(
+            "WARN: Could not fetch the %s feed(s); their events will not be deleted",
+            ", ".join(sorted(failed_sources))
+        )
+    
+    logger.normal(f"Found {len(google_events)} events in Google Calendar")
     logger.normal(f"Found {len(hipcamp_events)} events in HipCamp")
     
     # Debug: Dump HipCamp events details
     logger.debug("🔍 HIPCAMP EVENTS DETAILS:")
     for i, event in enumerate(hipcamp_events[:3]):  # Show first 3 events
-        logger.debug(f"   {i+1}. Summary: '{event.summary}'")
-        logger.debug(f"      ID: {getattr(event, 'source_id', 'N/A')}")
-        logger.debug(f"      Start: {getattr(event, 'start_time', 'N/A')}")
-        logger.debug(f"      End: {getattr(event, 'end_time', 'N/A')}")
-        logger.debug(f"      Description: '{getattr(event, 'description', 'N/A')[:100]}...'")
-    
-    # Get Checkfront events
-    checkfront_events = fetch_checkfront_events()
+        logger.debug("   %s. Summary: '%s'", i+1, event.summary)
+        logger.debug("      ID: %s", getattr(event, 'source_id', 'N/A'))
+        logger.debug("      Start: %s", getattr(event, 'start_time', 'N/A'))
+        logger.debug("      End: %s", getattr(event, 'end_time', 'N/A'))
+        logger.debug("      Description: '%s...'", getattr(event, 'description', 'N/A')[:100])
+    
     logger.normal(f"Found {len(checkfront_events)} events in Checkfront")
     
     # Debug: Dump Checkfront events details
     logger.debug("🔍 CHECKFRONT EVENTS DETAILS:")
     for i, event in enumerate(checkfront_events[:3]):  # Show first 3 events
-        logger.debug(f"   {i+1}. Summary: '{event.summary}'")
-        logger.debug(f"      ID: {getattr(event, 'source_id', 'N/A')}")
-        logger.debug(f"      Start: {getattr(event, 'start_time', 'N/A')}")
-        logger.debug(f"      End: {getattr(event, 'end_time', 'N/A')}")
-        logger.debug(f"      Description: '{getattr(event, 'description', 'N/A')[:100]}...'")
+        logger.debug("   %s. Summary: '%s'", i+1, event.summary)
+        logger.debug("      ID: %s", getattr(event, 'source_id', 'N/A'))
+        logger.debug("      Start: %s", getattr(event, 'start_time', 'N/A'))
+        logger.debug("      End: %s", getattr(event, 'end_time', 'N/A'))
+        logger.debug("      Description: '%s...'", getattr(event, 'description', 'N/A')[:100])
     
     # Sync events to main Google Calendar
-    sync_events_to_calendar(
+    changes = sync_events_to_calendar(
         service,
         dbr_calendar_id,
         hipcamp_events,
         checkfront_events,
-        google_events
+        google_events,
+        failed_sources
     )
     
     # Sync Checkfront events to site-specific calendars
@@ -1833,7 +2880,7 @@ def run_sync():
         
         # Get existing events for this calendar
         site_events = get_google_calendar_events(
-            service, calendar_id, start_time
+            service, calendar_id, start_time, sync_state_path
         )
         logger.normal(
             f"Found {len(site_events)} events in {site_code} Checkfront calendar"
@@ -1849,13 +2896,68 @@ def run_sync():
         )
         
         # Sync events to site-specific calendar
-        sync_events_to_calendar(
+        changes += sync_events_to_calendar(
             service,
             calendar_id,
             [],  # No HipCamp events for site-specific calendars
             site_checkfront_events,
-            site_events
+            site_events,
+            failed_sources
         )
+    
+    return changes
+
+
+def run_daemon(interval: int) -> None:
+    """
+    Run the sync repeatedly in this process.
+    
+    Credentials, the HTTP session and the on-disk sync tokens and ETags are
+    reused between cycles. The poll interval doubles (up to
+    MAX_DAEMON_INTERVAL seconds) while nothing changes and resets to the base
+    interval as soon as a sync makes changes. Google rate limit errors
+    (403/429) are retried with exponential backoff. Any other error is
+    logged and backs the interval off the same way as an unchanged sync, so
+    a persistent failure doesn't stop the daemon.
+    
+    All feeds share one interval. A sync has to see every feed to decide
+    which events to delete, and an unchanged feed only costs a conditional
+    GET answered with 304, so feeds are not scheduled separately.
+    
+    Args:
+        interval: Base number of seconds between syncs
+    """
+    current_interval = interval
+    attempt = 0
+    while True:
+        try:
+            changes = run_sync()
+        except HttpError as error:
+            rate_limited = error.resp.status == 429 or _http_error_has_reason(
+                error, 403, "rateLimitExceeded", "userRateLimitExceeded"
+            )
+            if rate_limited:
+                delay = min(60, 2 ** attempt)
+                attempt += 1
+                logger.warn(f"WARN: Google API rate limited, retrying in {delay}s")
+                time.sleep(delay)
+                continue
+            logger.warn(f"WARN: Sync failed: {error}")
+            changes = 0  # Back off until the error clears
+        except requests.exceptions.RequestException as e:
+            logger.warn(f"WARN: Sync failed: {e}")
+            changes = 1  # Poll again soon rather than backing off
+        except Exception as e:
+            logger.warn(f"WARN: Sync failed: {e!r}")
+            changes = 0  # Back off until the error clears
+        
+        attempt = 0
+        if changes:
+            current_interval = interval
+        else:
+            current_interval = min(current_interval * 2, MAX_DAEMON_INTERVAL)
+        logger.normal(f"Next sync in {current_interval}s")
+        time.sleep(current_interval)
 
 
 def main():
@@ -1868,15 +2970,34 @@ def main():
     parser.add_argument(
         "-v", "--verbose", action="count", default=0, help="Increase verbosity"
     )
+    parser.add_argument(
+        "--sync-state",
+        help="Path to the Google Calendar incremental sync state file; "
+             "enables incremental sync"
+    )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="Keep running and sync periodically instead of once"
+    )
+    parser.add_argument(
+        "--interval", type=int, default=300,
+        help="Base number of seconds between syncs in daemon mode"
+    )
     args = parser.parse_args()
 
+    if args.sync_state:
+        os.environ["GOOGLE_SYNC_STATE_PATH"] = args.sync_state
+
     # Set log level based on verbosity
     if args.verbose >= 2:
         logger.level = LogLevel.DEBUG
     elif args.verbose == 1:
         logger.level = LogLevel.NORMAL
 
-    run_sync()
+    if args.daemon:
+        run_daemon(args.interval)
+    else:
+        run_sync()
 
 
 if __name__ == "__main__":
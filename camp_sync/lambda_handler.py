@@ -1,12 +1,57 @@
 import json
-import boto3
 import os
 
-from core import run_sync, logger, LogLevel
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+from core import (
+    run_sync,
+    get_google_credentials,
+    get_calendar_service,
+    get_state_file_path,
+    resolve_calendar_ids,
+    logger,
+    LogLevel,
+)
+
+# Set once the secrets have been loaded in this execution environment. Warm
+# invocations reuse the files and the credentials that core keeps in memory
+# instead of calling Secrets Manager again.
+_SECRETS_LOADED = False
+
+# Where the secrets are written in Lambda; /tmp/ is the only writable path.
+# The Google secrets are handed to core in memory; the token path is only
+# written if the token has to be refreshed.
+LAMBDA_CREDENTIAL_PATHS = {
+    "CHECKFRONT_CREDENTIALS_PATH": "/tmp/checkfront_credentials.json",
+    "GOOGLE_CREDENTIALS_PATH": "/tmp/google_credentials.json",
+    "GOOGLE_TOKEN_PATH": "/tmp/token.json",
+    "SITE_CONFIG_PATH": "/tmp/site_configuration.json",
+}
+
+
+def json_loads(text):
+    """Decode JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_dumps(data):
+    """Encode data as a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
 
 
 def get_secret(secret_name):
     """Fetches a secret from AWS Secrets Manager."""
+    # boto3 is slow to import and only needed until the secrets are cached,
+    # so local runs and warm invocations never load it.
+    import boto3
+    
     region_name = os.environ.get("AWS_REGION", "us-east-1")
     session = boto3.session.Session()
     client = session.client(
@@ -57,6 +102,67 @@ def get_local_credentials():
     return None
 
 
+def load_aws_secrets():
+    """
+    Fetch the secrets from AWS Secrets Manager and hand them to core.
+    
+    The Checkfront credentials and site configuration are written to /tmp/
+    and the credential path environment variables are pointed at them. The
+    Google client config and token are used to seed core's in-memory
+    credentials. Does nothing once the secrets have been loaded.
+    """
+    global _SECRETS_LOADED
+    
+    if _SECRETS_LOADED:
+        print("♻️  Reusing credentials from a previous invocation")
+        return
+    
+    print("☁️  Using AWS Secrets Manager")
+    checkfront_creds = get_secret("checkfront_credentials")
+    google_client_config = json_loads(get_secret("google_credentials"))
+    google_token_info = json_loads(get_secret("google_token"))
+    site_config = get_secret("site_configuration")
+    
+    with open(LAMBDA_CREDENTIAL_PATHS["CHECKFRONT_CREDENTIALS_PATH"], "w") as f:
+        f.write(checkfront_creds)
+    with open(LAMBDA_CREDENTIAL_PATHS["SITE_CONFIG_PATH"], "w") as f:
+        f.write(site_config)
+    os.environ.update(LAMBDA_CREDENTIAL_PATHS)
+    
+    # Seed core's in-memory credentials; run_sync picks them up
+    get_google_credentials(
+        token_info=google_token_info,
+        client_config=google_client_config
+    )
+    _SECRETS_LOADED = True
+
+
+def _init():
+    """
+    Prepare the execution environment during the Lambda INIT phase.
+    
+    Loading the secrets, building the Calendar service and resolving the
+    calendar IDs at import time keeps that work out of the billed duration
+    of the first invocation. core memoizes the service and calendar IDs, so
+    run_sync reuses them. Any failure is logged and the handler loads the
+    secrets itself on the first invocation instead.
+    """
+    if is_running_locally():
+        return
+    
+    try:
+        load_aws_secrets()
+        resolve_calendar_ids(
+            get_calendar_service(),
+            get_state_file_path("CALENDAR_ID_CACHE_PATH", "calendar_id_cache.json")
+        )
+    except Exception as e:
+        print(f"WARN: Initialization failed, retrying in the handler: {e}")
+
+
+_init()
+
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler function.
@@ -65,7 +171,7 @@ def lambda_handler(event, context):
     or uses local credential files when running locally for testing.
     """
     # Log the raw event received by the handler to see its structure.
-    print(f"Received event: {json.dumps(event)}")
+    print(f"Received event: {json_dumps(event)}")
     
     try:
         # Set log level from environment variable
@@ -109,86 +215,40 @@ def lambda_handler(event, context):
                 else:
                     print(f"❌ {name}: {path} (file not found)")
             
+            # Set environment variables to point to the credential files
+            os.environ["CHECKFRONT_CREDENTIALS_PATH"] = checkfront_path
+            os.environ["GOOGLE_CREDENTIALS_PATH"] = google_creds_path
+            os.environ["GOOGLE_TOKEN_PATH"] = google_token_path
+            os.environ["SITE_CONFIG_PATH"] = site_config_path
         else:
-            # Use AWS Secrets Manager (production mode)
-            print("☁️  Using AWS Secrets Manager")
-            checkfront_creds = get_secret("checkfront_credentials")
-            google_creds = get_secret("google_credentials")
-            google_token = get_secret("google_token")
-            site_config = get_secret("site_configuration")
-
-            # The core script expects credentials to be in files.
-            # We'll write them to the /tmp/ directory, which is writable in Lambda.
-            checkfront_path = "/tmp/checkfront_credentials.json"
-            google_creds_path = "/tmp/google_credentials.json"
-            google_token_path = "/tmp/token.json"
-            site_config_path = "/tmp/site_configuration.json"
-
-            with open(checkfront_path, "w") as f:
-                f.write(checkfront_creds)
-            with open(google_creds_path, "w") as f:
-                f.write(google_creds)
-            with open(google_token_path, "w") as f:
-                f.write(google_token)
-            with open(site_config_path, "w") as f:
-                f.write(site_config)
-
-        # Set environment variables to point to the credential files
-        os.environ["CHECKFRONT_CREDENTIALS_PATH"] = checkfront_path
-        os.environ["GOOGLE_CREDENTIALS_PATH"] = google_creds_path
-        os.environ["GOOGLE_TOKEN_PATH"] = google_token_path
-        os.environ["SITE_CONFIG_PATH"] = site_config_path
+            # Use AWS Secrets Manager (production mode); normally already
+            # done by _init() during the INIT phase.
+            load_aws_secrets()
 
         print("Starting calendar sync process...")
         
-        # Add detailed event dumps for debugging
-        print("\n" + "="*60)
-        print("🔍 DEBUG: EVENT DUMP BEFORE SYNC")
-        print("="*60)
-        
-        # Import the core functions to get event counts and details
-        from core import fetch_hipcamp_events, fetch_checkfront_events, logger as core_logger
-        
-        try:
-            # Get and dump HipCamp events
-            print("\n📋 HIPCAMP EVENTS:")
-            hipcamp_events = fetch_hipcamp_events()
-            print(f"   Total HipCamp events found: {len(hipcamp_events)}")
-            for i, event in enumerate(hipcamp_events[:5]):  # Show first 5 events
-                print(f"   {i+1}. {event.summary} (ID: {getattr(event, 'source_id', 'N/A')}) "
-                      f"Date: {getattr(event, 'start_time', 'N/A')} to {getattr(event, 'end_time', 'N/A')}")
-            if len(hipcamp_events) > 5:
-                print(f"   ... and {len(hipcamp_events) - 5} more events")
-            
-            # Get and dump Checkfront events
-            print("\n📋 CHECKFRONT EVENTS:")
-            checkfront_events = fetch_checkfront_events()
-            print(f"   Total Checkfront events found: {len(checkfront_events)}")
-            for i, event in enumerate(checkfront_events[:5]):  # Show first 5 events
-                print(f"   {i+1}. {event.summary} (ID: {getattr(event, 'source_id', 'N/A')}) "
-                      f"Date: {getattr(event, 'start_time', 'N/A')} to {getattr(event, 'end_time', 'N/A')}")
-            if len(checkfront_events) > 5:
-                print(f"   ... and {len(checkfront_events) - 5} more events")
-                
-        except Exception as e:
-            print(f"⚠️  Warning: Could not dump events for debugging: {e}")
-        
+        # run_sync fetches the HipCamp, Checkfront and Google Calendar events
+        # concurrently and logs their counts (and samples at DEBUG level),
+        # so the feeds are not downloaded a second time here just to dump them.
         print("="*60)
         print("🔄 STARTING SYNC PROCESS")
         print("="*60)
         
-        run_sync()
-        print("Calendar sync process finished successfully.")
+        changes = run_sync()
+        print(f"Calendar sync process finished successfully ({changes} changes).")
 
         return {
             'statusCode': 200,
-            'body': json.dumps('Sync completed successfully!')
+            'body': json_dumps({
+                'message': 'Sync completed successfully!',
+                'changes': changes
+            })
         }
     except Exception as e:
         # Use the configured logger to log the exception
         error_message = f"FATAL: An unhandled exception occurred: {e}"
         try:
-            core_logger.warn(error_message)
+            logger.warn(error_message)
         except:
             # Fallback to print if logger fails
             pass
@@ -267,19 +267,34 @@ def get_google_calendar_events(
         HttpError: If the Google Calendar API request fails
     """
     try:
-        events_result = (
-            service.events()
-            .list(
-                calendarId=calendar_id,
-                timeMin=start_time.isoformat(),
-                singleEvents=True,
-                orderBy="startTime",
+        # Page through the results; a single list call stops at 250 events.
+        # The fields mask limits each page to what is read below.
+        items = []
+        page_token = None
+        while True:
+            events_result = (
+                service.events()
+                .list(
+                    calendarId=calendar_id,
+                    timeMin=start_time.isoformat(),
+                    singleEvents=True,
+                    orderBy="startTime",
+                    maxResults=2500,
+                    pageToken=page_token,
+                    fields=(
+                        "nextPageToken,items(id,summary,description,start,end,"
+                        "extendedProperties/private)"
+                    ),
+                )
+                .execute()
             )
-            .execute()
-        )
+            items.extend(events_result.get("items", []))
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
         
         events = []
-        for event in events_result.get("items", []):
+        for event in items:
             # Get the Lodgify ID from extended properties if it exists
             lodgify_id = None
             if "extendedProperties" in event:
@@ -459,20 +474,29 @@ def main():
     creds = get_google_credentials(force_refresh=False)
 
     try:
-        service = build("calendar", "v3", credentials=creds)
+        # Use the discovery document bundled with google-api-python-client
+        # instead of downloading it on every run
+        service = build(
+            "calendar", "v3",
+            credentials=creds,
+            cache_discovery=False,
+            static_discovery=True
+        )
 
         # First, list all calendars to find the DBR Cabin Rentals calendar
         print("Listing all calendars...")
-        calendar_list = service.calendarList().list().execute()
-        dbr_calendar_id = None
-        
-        for calendar in calendar_list.get('items', []):
-            print(f"Calendar: {calendar['summary']} (ID: {calendar['id']})")
-            if calendar['summary'] == "DBR Cabin Rentals":
-                dbr_calendar_id = calendar['id']
-                break
+        calendar_list = service.calendarList().list(
+            fields="items(id,summary)"
+        ).execute()
+        calendar_ids = {
+            calendar['summary']: calendar['id']
+            for calendar in calendar_list.get('items', [])
+        }
+        dbr_calendar_id = calendar_ids.get("DBR Cabin Rentals")
         
         if not dbr_calendar_id:
+            for summary, calendar_id in calendar_ids.items():
+                print(f"Calendar: {summary} (ID: {calendar_id})")
             print("DBR Cabin Rentals calendar not found!")
             return
 